@@ -7,11 +7,111 @@ For the original monolithic version, see app_backup.py
 """
 
 import os
+import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from database import init_db
 from routes import create_and_configure_app
 from backup_service import start_backup_scheduler
+from notification_service import notification_queue
+
+# Log buffering settings (overridable through the environment)
+LOG_BUFFER_BYTES = int(os.environ.get('HT_LOG_BUFFER_BYTES', 64 * 1024))
+LOG_FLUSH_INTERVAL = float(os.environ.get('HT_LOG_FLUSH_INTERVAL', 30))
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that re-renders the timestamp at most once per second"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_second = None
+        self._last_time_str = ''
+    
+    def formatTime(self, record, datefmt=None):
+        """Format the record time, reusing the cached seconds part"""
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_time_str = time.strftime(datefmt or self.default_time_format,
+                                                self.converter(second))
+            self._last_second = second
+        if datefmt:
+            return self._last_time_str
+        return self.default_msec_format % (self._last_time_str, record.msecs)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that buffers writes and flushes periodically"""
+    
+    def __init__(self, filename, buffer_size=LOG_BUFFER_BYTES, flush_interval=LOG_FLUSH_INTERVAL, **kwargs):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._bytes_written = 0
+        super().__init__(filename, **kwargs)
+        
+        # Flush the buffer on a timer so quiet periods still reach the disk
+        self._flush_stop = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+    
+    def _open(self):
+        """Open the log file with a large write buffer"""
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        
+        # Size the file once here; emit keeps a running count after that
+        try:
+            self._bytes_written = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._bytes_written = 0
+        return stream
+    
+    def _flush_loop(self):
+        """Flush buffered records every flush_interval seconds"""
+        while not self._flush_stop.wait(self.flush_interval):
+            self.flush()
+    
+    def _encoded_length(self, msg):
+        """Size of msg in the log file, in bytes (the count is seeded from the file size)"""
+        return len(msg.encode(self.stream.encoding, self.stream.errors))
+    
+    def _would_overflow(self, length):
+        """Check whether writing length more bytes would exceed maxBytes"""
+        return self.maxBytes > 0 and self._bytes_written + length >= self.maxBytes
+    
+    def shouldRollover(self, record):
+        """Check rollover against the running byte count instead of the filesystem"""
+        if self.stream is None:
+            self.stream = self._open()
+        return self._would_overflow(self._encoded_length(self.format(record) + self.terminator))
+    
+    def emit(self, record):
+        """Write a record to the buffer, flushing immediately for errors"""
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            length = self._encoded_length(msg)
+            if self._would_overflow(length):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes_written += length
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        """Stop the flush timer and close the file"""
+        self._flush_stop.set()
+        super().close()
 
 
 def setup_logging():
@@ -24,12 +124,12 @@ def setup_logging():
     log_file = os.path.join(logs_dir, 'app.log')
     
     # Create formatter
-    formatter = logging.Formatter(
+    formatter = CachedTimeFormatter(
         '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
     )
     
-    # Create file handler with rotation
-    file_handler = RotatingFileHandler(
+    # Create buffered file handler with rotation
+    file_handler = BufferedRotatingFileHandler(
         log_file, 
         maxBytes=1024*1024*10,  # 10MB
         backupCount=5
@@ -39,13 +139,36 @@ def setup_logging():
     
     # Create console handler
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s: %(message)s'))
+    console_handler.setFormatter(CachedTimeFormatter('%(asctime)s %(levelname)s: %(message)s'))
     console_handler.setLevel(logging.INFO)
     
-    # Configure root logger
+    # Log calls only enqueue records; a listener thread does the actual I/O
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    
+    def shutdown():
+        # Send bookings still waiting for the next batch first, while their
+        # results can still be logged, then drain the log queue and close the file
+        notification_queue.flush()
+        listener.stop()
+        file_handler.close()
+    
+    # atexit runs the last registration first; notification_service registered
+    # its own flush on import, which would otherwise run after the listener stopped
+    atexit.unregister(notification_queue.flush)
+    atexit.register(shutdown)
+    
+    # Records are formatted by the listener's handlers, so pass the message through as-is
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    # Configure root logger; force replaces any handler a module installed
+    # on import, which would otherwise make basicConfig a no-op
     logging.basicConfig(
         level=logging.INFO,
-        handlers=[file_handler, console_handler]
+        handlers=[queue_handler],
+        force=True
     )
     
     return logging.getLogger(__name__)
@@ -7,14 +7,51 @@ import os
 import shutil
 import sqlite3
 import logging
-import schedule
-import time
 import threading
+from collections import deque
+from contextlib import closing
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Supported backup modes
+BACKUP_MODE_SQLITE_API = 'sqlite_backup_api'
+BACKUP_MODE_VACUUM_INTO = 'vacuum_into'
+BACKUP_MODE_INCREMENTAL = 'incremental_pages'
+BACKUP_MODES = (BACKUP_MODE_SQLITE_API, BACKUP_MODE_VACUUM_INTO, BACKUP_MODE_INCREMENTAL)
+
+# Rolling base file updated in place by incremental backups
+INCREMENTAL_BACKUP_NAME = 'himanshi_travels_backup_incremental.db'
+
+# Size of the per-page digests stored by incremental backups, and the
+# extensions of the digest files (one per hash _get_page_hasher may pick)
+PAGE_DIGEST_SIZE = 32
+PAGE_DIGEST_EXTENSIONS = ('blake3', 'sha256')
+
+# Upper bound on concurrent deletions during cleanup
+CLEANUP_MAX_WORKERS = 8
+
+# Time of day (hour, minute) at which scheduled backups run
+BACKUP_TIME = (2, 0)
+
+
+@lru_cache(maxsize=None)
+def _get_page_hasher():
+    """Get (name, hash function) used for incremental backup pages
+    
+    blake3 is optional and SIMD accelerated, while OpenSSL's sha256 uses the
+    SHA extensions on CPUs that have them. Imported on first use only.
+    """
+    try:
+        import blake3
+        return 'blake3', lambda data: blake3.blake3(data).digest()
+    except ImportError:
+        import hashlib
+        return 'sha256', lambda data: hashlib.sha256(data).digest()
+
+
 class BackupService:
     """Database backup service"""
     
@@ -22,7 +59,14 @@ class BackupService:
         self.config = None
         self._initialized = False
         self._scheduler_running = False
-        self._scheduler_thread = None
+        self._timer = None
+        self._frequency = 'daily'
+        self._list_cache = None  # (directory mtime_ns, backups)
+        
+        # Scheduled backups are handed to a single worker thread
+        self._backup_queue = deque(maxlen=4)
+        self._backup_event = threading.Event()
+        self._worker = None
     
     def _init_config(self):
         """Initialize backup configuration"""
@@ -52,6 +96,17 @@ class BackupService:
             return 'daily'
         return self.config.get_str('backup_frequency', 'daily')
     
+    def get_backup_mode(self) -> str:
+        """Get backup mode"""
+        self._init_config()
+        if not self.config:
+            return BACKUP_MODE_SQLITE_API
+        mode = self.config.get_str('backup_mode', BACKUP_MODE_SQLITE_API)
+        if mode not in BACKUP_MODES:
+            logger.warning(f"Unknown backup mode: {mode}, defaulting to {BACKUP_MODE_SQLITE_API}")
+            return BACKUP_MODE_SQLITE_API
+        return mode
+    
     def get_backup_directory(self) -> str:
         """Get backup directory path"""
         backup_dir = 'backups'
@@ -70,10 +125,14 @@ class BackupService:
         
         try:
             backup_dir = self.get_backup_directory()
+            mode = self.get_backup_mode()
             
             if not backup_name:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                backup_name = f"himanshi_travels_backup_{timestamp}.db"
+                if mode == BACKUP_MODE_INCREMENTAL:
+                    backup_name = INCREMENTAL_BACKUP_NAME
+                else:
+                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                    backup_name = f"himanshi_travels_backup_{timestamp}.db"
             
             backup_path = os.path.join(backup_dir, backup_name)
             
@@ -84,27 +143,33 @@ class BackupService:
                     'message': f'Source database not found: {self.database_file}'
                 }
             
-            # Create backup using SQLite backup API (more reliable than file copy)
-            source_conn = sqlite3.connect(self.database_file)
-            backup_conn = sqlite3.connect(backup_path)
+            pages_written = None
+            if mode == BACKUP_MODE_VACUUM_INTO:
+                self._backup_vacuum_into(backup_path)
+            elif mode == BACKUP_MODE_INCREMENTAL:
+                pages_written = self._backup_incremental(backup_path)
+            else:
+                self._backup_sqlite_api(backup_path)
             
-            try:
-                source_conn.backup(backup_conn)
-                logger.info(f"Database backup created: {backup_path}")
-                
-                # Get backup file size
-                backup_size = os.path.getsize(backup_path)
-                
-                return {
-                    'success': True,
-                    'message': f'Backup created successfully: {backup_name}',
-                    'backup_path': backup_path,
-                    'backup_size': backup_size,
-                    'timestamp': datetime.now().isoformat()
-                }
-            finally:
-                source_conn.close()
-                backup_conn.close()
+            logger.info(f"Database backup created ({mode}): {backup_path}")
+            
+            # Incremental backups rewrite a file in place without touching the directory mtime
+            self._list_cache = None
+            
+            # Get backup file size
+            backup_size = os.path.getsize(backup_path)
+            
+            result = {
+                'success': True,
+                'message': f'Backup created successfully: {backup_name}',
+                'backup_path': backup_path,
+                'backup_size': backup_size,
+                'backup_mode': mode,
+                'timestamp': datetime.now().isoformat()
+            }
+            if pages_written is not None:
+                result['pages_written'] = pages_written
+            return result
                 
         except Exception as e:
             logger.error(f"Failed to create backup: {e}")
@@ -113,36 +178,253 @@ class BackupService:
                 'message': f'Backup failed: {str(e)}'
             }
     
-    def list_backups(self) -> List[Dict[str, Any]]:
-        """List all available backups"""
+    def _backup_sqlite_api(self, backup_path: str):
+        """Copy every page of the database using the SQLite backup API"""
+        self._publish_atomically(backup_path, self._copy_database)
+    
+    def _backup_vacuum_into(self, backup_path: str):
+        """Write a compacted snapshot of the database with VACUUM INTO"""
+        self._publish_atomically(backup_path, self._vacuum_into)
+    
+    def _vacuum_into(self, dest_path: str):
+        """Run VACUUM INTO dest_path against the live database"""
+        with closing(self._open_source()) as source_conn:
+            source_conn.execute("VACUUM INTO ?", (dest_path,))
+        
+        with closing(sqlite3.connect(dest_path)) as backup_conn:
+            self._cleanup_wal(backup_conn)
+    
+    @staticmethod
+    def _publish_atomically(backup_path: str, write):
+        """Write a backup to a temporary path and rename it into place once complete
+        
+        Readers of the backup directory never see a half-written file.
+        """
+        tmp_path = backup_path + '.tmp'
+        
+        # Leftovers from an interrupted run would make VACUUM INTO fail
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        
         try:
-            backup_dir = self.get_backup_directory()
-            backups = []
+            write(tmp_path)
+            os.replace(tmp_path, backup_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    def _backup_incremental(self, backup_path: str) -> int:
+        """Update a rolling base backup, rewriting only the pages that changed
+        
+        Returns the number of pages written.
+        """
+        import mmap
+        import tempfile
+        
+        # Take a consistent snapshot first so the source is not locked while hashing
+        fd, snapshot_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        
+        try:
+            self._copy_database(snapshot_path)
             
-            if not os.path.exists(backup_dir):
-                return backups
+            snapshot_conn = sqlite3.connect(snapshot_path)
+            try:
+                page_size = snapshot_conn.execute("PRAGMA page_size").fetchone()[0]
+            finally:
+                snapshot_conn.close()
             
-            for filename in os.listdir(backup_dir):
-                if filename.endswith('.db'):
-                    filepath = os.path.join(backup_dir, filename)
-                    stat = os.stat(filepath)
+            snapshot_size = os.path.getsize(snapshot_path)
+            page_count = snapshot_size // page_size
+            
+            # Only the rolling base is patched again by later runs, so only it keeps
+            # page digests; a named backup is a plain copy of the snapshot
+            if os.path.basename(backup_path) == INCREMENTAL_BACKUP_NAME:
+                hash_path = f"{backup_path}.{_get_page_hasher()[0]}"
+            else:
+                hash_path = None
+            
+            with open(snapshot_path, 'rb') as src_file, \
+                    mmap.mmap(src_file.fileno(), 0, access=mmap.ACCESS_READ) as src_map:
+                new_digests = self._page_digests(src_map, page_size, page_count)
+                
+                # No base yet - the snapshot becomes the base
+                if not os.path.exists(backup_path) or os.path.getsize(backup_path) == 0:
+                    self._replace_base(backup_path, hash_path, new_digests,
+                                       lambda tmp_path: shutil.copyfile(snapshot_path, tmp_path))
+                    return page_count
+                
+                with open(backup_path, 'rb') as base_file:
+                    base_size = os.fstat(base_file.fileno()).st_size
+                    base_pages = base_size // page_size
                     
-                    backups.append({
-                        'filename': filename,
-                        'path': filepath,
-                        'size': stat.st_size,
-                        'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                        'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
-                    })
+                    old_digests = self._read_page_digests(hash_path, base_pages) if hash_path else None
+                    if old_digests is None:
+                        with mmap.mmap(base_file.fileno(), 0, access=mmap.ACCESS_READ) as base_map:
+                            old_digests = self._page_digests(base_map, page_size, base_pages)
+                
+                # Pages past the end of the base are always new
+                size = PAGE_DIGEST_SIZE
+                changed = [page for page in range(min(page_count, base_pages))
+                           if new_digests[page * size:(page + 1) * size]
+                           != old_digests[page * size:(page + 1) * size]]
+                changed.extend(range(base_pages, page_count))
+                
+                # Patch the base in place, so a run writes only the changed pages. Its
+                # digests are dropped first and saved again only once the pages are
+                # on disk: after an interrupted run the next one finds none, hashes
+                # the base itself and rewrites every page that still differs
+                if hash_path and os.path.exists(hash_path):
+                    os.remove(hash_path)
+                
+                with open(backup_path, 'r+b') as dst_file:
+                    dst_fd = dst_file.fileno()
+                    for page in changed:
+                        offset = page * page_size
+                        os.pwrite(dst_fd, src_map[offset:offset + page_size], offset)
+                    
+                    if base_size != snapshot_size:
+                        dst_file.truncate(snapshot_size)
+                    os.fsync(dst_fd)
+                
+                if hash_path:
+                    self._save_page_digests(hash_path, new_digests)
             
-            # Sort by creation time (newest first)
-            backups.sort(key=lambda x: x['created'], reverse=True)
-            return backups
+            return len(changed)
+        finally:
+            os.remove(snapshot_path)
+    
+    def _replace_base(self, backup_path: str, hash_path: Optional[str], digests: bytes, write):
+        """Publish a new incremental base, then the page digests that describe it
+        
+        The old digests are removed first: if the run stops between the two
+        steps, the next one finds no digests and hashes the base itself rather
+        than trusting digests of a file that was replaced.
+        """
+        if hash_path and os.path.exists(hash_path):
+            os.remove(hash_path)
+        self._publish_atomically(backup_path, write)
+        if hash_path:
+            self._save_page_digests(hash_path, digests)
+    
+    def _save_page_digests(self, hash_path: str, digests: bytes):
+        """Write page digests next to the base, replacing the old file atomically"""
+        self._publish_atomically(hash_path, lambda tmp_path: self._write_page_digests(tmp_path, digests))
+    
+    @staticmethod
+    def _delete_backup(backup_path: str):
+        """Delete a backup file together with any page digests kept for it"""
+        os.remove(backup_path)
+        for extension in PAGE_DIGEST_EXTENSIONS:
+            try:
+                os.remove(f"{backup_path}.{extension}")
+            except FileNotFoundError:
+                pass
+    
+    def _open_source(self) -> sqlite3.Connection:
+        """Open the live database for reading a backup"""
+        # Autocommit mode, so reading never opens an implicit transaction
+        source_conn = sqlite3.connect(self.database_file, isolation_level=None)
+        try:
+            source_conn.execute("PRAGMA synchronous=NORMAL")
             
+            # Fold committed WAL frames into the main file without blocking writers
+            source_conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        except Exception:
+            source_conn.close()
+            raise
+        return source_conn
+    
+    def _cleanup_wal(self, backup_conn: sqlite3.Connection):
+        """Make a backup file self-contained by checkpointing it and leaving WAL mode"""
+        if not self.config.get_bool('backup_wal_cleanup', True):
+            return
+        backup_conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        backup_conn.execute("PRAGMA journal_mode=DELETE")
+    
+    def _copy_database(self, dest_path: str):
+        """Copy the live database to dest_path using the SQLite backup API"""
+        with closing(self._open_source()) as source_conn, \
+                closing(sqlite3.connect(dest_path)) as dest_conn:
+            source_conn.backup(dest_conn)
+            self._cleanup_wal(dest_conn)
+    
+    @staticmethod
+    def _page_digests(buf, page_size: int, page_count: int) -> bytes:
+        """Hash every page of buf, returning the digests concatenated in page order"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        page_hash = _get_page_hasher()[1]
+        
+        def scan(start, stop):
+            return b''.join(page_hash(buf[page * page_size:(page + 1) * page_size])
+                            for page in range(start, stop))
+        
+        workers = os.cpu_count() or 1
+        chunk = max(1, -(-page_count // workers))
+        ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+        
+        # The hash functions release the GIL for page-sized buffers, so threads scale here
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return b''.join(executor.map(lambda r: scan(*r), ranges))
+    
+    @staticmethod
+    def _read_page_digests(hash_path: str, page_count: int) -> Optional[bytes]:
+        """Load the page digests saved with the last incremental backup, if still valid"""
+        try:
+            with open(hash_path, 'rb') as hash_file:
+                digests = hash_file.read()
+        except OSError:
+            return None
+        if len(digests) != page_count * PAGE_DIGEST_SIZE:
+            return None
+        return digests
+    
+    @staticmethod
+    def _write_page_digests(hash_path: str, digests: bytes):
+        """Save page digests alongside an incremental backup"""
+        with open(hash_path, 'wb') as hash_file:
+            hash_file.write(digests)
+            hash_file.flush()
+            os.fsync(hash_file.fileno())
+    
+    def list_backups(self) -> List[Dict[str, Any]]:
+        """List all available backups"""
+        try:
+            return list(self._list_backups())
         except Exception as e:
             logger.error(f"Failed to list backups: {e}")
             return []
     
+    def _list_backups(self) -> List[Dict[str, Any]]:
+        """Get the cached backup list, newest first (callers must not modify it)"""
+        backup_dir = self.get_backup_directory()
+        
+        # The directory mtime changes whenever a backup is added or removed
+        dir_mtime = os.stat(backup_dir).st_mtime_ns
+        if self._list_cache and self._list_cache[0] == dir_mtime:
+            return self._list_cache[1]
+        
+        backups = []
+        with os.scandir(backup_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.db') and entry.is_file():
+                    stat = entry.stat()
+                    
+                    backups.append({
+                        'filename': entry.name,
+                        'path': os.path.join(backup_dir, entry.name),
+                        'size': stat.st_size,
+                        'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                        'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
+                    })
+        
+        # Sort by creation time (newest first)
+        backups.sort(key=lambda x: x['created'], reverse=True)
+        self._list_cache = (dir_mtime, backups)
+        return backups
+    
     def restore_backup(self, backup_filename: str) -> Dict[str, Any]:
         """Restore database from backup"""
         self._init_config()
@@ -168,8 +450,15 @@ class BackupService:
             if not current_backup_result['success']:
                 logger.warning(f"Failed to backup current database before restore: {current_backup_result['message']}")
             
-            # Restore backup
-            shutil.copy2(backup_path, self.database_file)
+            # Restore through the SQLite backup API rather than over the file: the live
+            # database stays in WAL mode, and connections other threads keep open
+            # read the restored pages instead of a file swapped out from under them
+            with closing(sqlite3.connect(backup_path)) as backup_conn, \
+                    closing(sqlite3.connect(self.database_file)) as live_conn:
+                backup_conn.backup(live_conn)
+            
+            from database import invalidate_search_counts
+            invalidate_search_counts()
             
             logger.info(f"Database restored from backup: {backup_filename}")
             return {
@@ -186,10 +475,15 @@ class BackupService:
                 'message': f'Restore failed: {str(e)}'
             }
     
-    def cleanup_old_backups(self, keep_count: int = 10) -> Dict[str, Any]:
-        """Clean up old backups, keeping only the most recent ones"""
+    def cleanup_old_backups(self, keep_count: int = 10,
+                            backups: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Clean up old backups, keeping only the most recent ones
+        
+        An already sorted list from list_backups() can be passed in to skip rescanning.
+        """
         try:
-            backups = self.list_backups()
+            if backups is None:
+                backups = self._list_backups()
             
             if len(backups) <= keep_count:
                 return {
@@ -198,15 +492,22 @@ class BackupService:
                     'deleted_count': 0
                 }
             
-            # Delete old backups
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+            
+            # Delete old backups, overlapping the unlink latency across files
+            old_backups = backups[keep_count:]
             deleted_count = 0
-            for backup in backups[keep_count:]:
-                try:
-                    os.remove(backup['path'])
-                    deleted_count += 1
-                    logger.info(f"Deleted old backup: {backup['filename']}")
-                except Exception as e:
-                    logger.error(f"Failed to delete backup {backup['filename']}: {e}")
+            with ThreadPoolExecutor(max_workers=min(CLEANUP_MAX_WORKERS, len(old_backups))) as executor:
+                futures = {executor.submit(self._delete_backup, backup['path']): backup
+                           for backup in old_backups}
+                for future in as_completed(futures):
+                    backup = futures[future]
+                    try:
+                        future.result()
+                        deleted_count += 1
+                        logger.info(f"Deleted old backup: {backup['filename']}")
+                    except Exception as e:
+                        logger.error(f"Failed to delete backup {backup['filename']}: {e}")
             
             return {
                 'success': True,
@@ -233,41 +534,90 @@ class BackupService:
             return
         
         frequency = self.get_backup_frequency()
-        
-        # Clear any existing schedules
-        schedule.clear('backup')
-        
-        # Schedule based on frequency
-        if frequency == 'daily':
-            schedule.every().day.at("02:00").do(self._scheduled_backup).tag('backup')
-        elif frequency == 'weekly':
-            schedule.every().week.at("02:00").do(self._scheduled_backup).tag('backup')
-        elif frequency == 'monthly':
-            schedule.every(30).days.at("02:00").do(self._scheduled_backup).tag('backup')
-        else:
+        if frequency not in ('daily', 'weekly', 'monthly'):
             logger.warning(f"Unknown backup frequency: {frequency}, defaulting to daily")
-            schedule.every().day.at("02:00").do(self._scheduled_backup).tag('backup')
+            frequency = 'daily'
         
+        self._frequency = frequency
         self._scheduler_running = True
         
-        # Start scheduler in a separate thread
-        def run_scheduler():
-            logger.info(f"Backup scheduler started with {frequency} frequency")
-            while self._scheduler_running:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+        self._worker = threading.Thread(target=self._backup_worker, daemon=True)
+        self._worker.start()
+        self._schedule_next_run()
         
-        self._scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-        self._scheduler_thread.start()
-        
-        logger.info("Backup scheduler thread started")
+        logger.info(f"Backup scheduler started with {frequency} frequency")
     
     def stop_scheduler(self):
         """Stop the backup scheduler"""
         self._scheduler_running = False
-        schedule.clear('backup')
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        
+        # Wake the worker so it can exit
+        self._backup_queue.clear()
+        self._backup_event.set()
         logger.info("Backup scheduler stopped")
     
+    @staticmethod
+    def _compute_next_run(frequency: str, now: Optional[datetime] = None) -> float:
+        """Get the number of seconds until the next scheduled backup"""
+        now = now or datetime.now()
+        hour, minute = BACKUP_TIME
+        next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        
+        # A timer can fire slightly early; never schedule a run within the next minute
+        earliest = now + timedelta(minutes=1)
+        
+        if frequency == 'weekly':
+            # Next Monday at the backup time
+            next_run += timedelta(days=(7 - now.weekday()) % 7)
+            if next_run <= earliest:
+                next_run += timedelta(days=7)
+        elif frequency == 'monthly':
+            next_run += timedelta(days=30)
+        elif next_run <= earliest:
+            next_run += timedelta(days=1)
+        
+        return (next_run - now).total_seconds()
+    
+    def _schedule_next_run(self):
+        """Arm a timer that sleeps until the next scheduled backup"""
+        delay = self._compute_next_run(self._frequency)
+        self._timer = threading.Timer(delay, self._fire_and_reschedule)
+        self._timer.daemon = True
+        self._timer.start()
+        logger.info(f"Next scheduled backup in {delay / 3600:.1f} hours")
+    
+    def _fire_and_reschedule(self):
+        """Queue a scheduled backup for the worker, then re-arm the timer"""
+        try:
+            if self._backup_queue:
+                # A backup is still pending; running another would only duplicate it
+                logger.warning("Previous scheduled backup still pending, skipping this run")
+            else:
+                self._backup_queue.append(datetime.now())
+                self._backup_event.set()
+        finally:
+            if self._scheduler_running:
+                self._schedule_next_run()
+    
+    def _backup_worker(self):
+        """Run queued scheduled backups one at a time"""
+        while self._scheduler_running:
+            self._backup_event.wait()
+            self._backup_event.clear()
+            
+            while self._backup_queue and self._scheduler_running:
+                requested_at = self._backup_queue[0]
+                logger.info(f"Running scheduled backup requested at {requested_at.isoformat()}")
+                try:
+                    self._scheduled_backup()
+                finally:
+                    # Leave the entry queued while running so the timer sees it as pending
+                    if self._backup_queue:
+                        self._backup_queue.popleft()
+    
     def _scheduled_backup(self):
         """Perform a scheduled backup"""
         try:
@@ -275,8 +625,8 @@ class BackupService:
             if result['success']:
                 logger.info(f"Scheduled backup completed: {result['message']}")
                 
-                # Cleanup old backups
-                cleanup_result = self.cleanup_old_backups()
+                # Cleanup old backups, reusing the list that is already sorted
+                cleanup_result = self.cleanup_old_backups(backups=self._list_backups())
                 if cleanup_result['success']:
                     logger.info(f"Backup cleanup: {cleanup_result['message']}")
             else:
@@ -2,8 +2,9 @@
 Configuration module for Himanshi Travels
 """
 
-from .manager import ConfigManager
+from .manager import ConfigManager, get_config_manager, is_sensitive_key
 from .types import ConfigType, ConfigCategory, ConfigField
 from .validators import ConfigValidator
 
-__all__ = ['ConfigManager', 'ConfigType', 'ConfigCategory', 'ConfigField', 'ConfigValidator']
+__all__ = ['ConfigManager', 'ConfigType', 'ConfigCategory', 'ConfigField', 'ConfigValidator',
+           'get_config_manager', 'is_sensitive_key']
@@ -1,23 +1,27 @@
 """
 Configuration categories module
+
+Category classes are imported lazily on first attribute access.
 """
 
-from .business import BusinessConfig
-from .email import EmailConfig
-from .whatsapp import WhatsAppConfig
-from .sms import SMSConfig
-from .pdf import PDFConfig
-from .database import DatabaseConfig
-from .backup import BackupConfig
-from .security import SecurityConfig
+import importlib
+
+_CATEGORY_MODULES = {
+    'BusinessConfig': 'business',
+    'EmailConfig': 'email',
+    'WhatsAppConfig': 'whatsapp',
+    'SMSConfig': 'sms',
+    'PDFConfig': 'pdf',
+    'DatabaseConfig': 'database',
+    'BackupConfig': 'backup',
+    'SecurityConfig': 'security'
+}
+
+__all__ = list(_CATEGORY_MODULES)
+
 
-__all__ = [
-    'BusinessConfig',
-    'EmailConfig', 
-    'WhatsAppConfig',
-    'SMSConfig',
-    'PDFConfig',
-    'DatabaseConfig',
-    'BackupConfig',
-    'SecurityConfig'
-]
+def __getattr__(name):
+    if name in _CATEGORY_MODULES:
+        module = importlib.import_module(f'.{_CATEGORY_MODULES[name]}', __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,176 +3,240 @@ Main configuration manager for Himanshi Travels
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Set
+import importlib
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Any, Mapping, Optional, Tuple
 from .types import ConfigField, ConfigType, ConfigCategory
 from .validators import ConfigValidator
-from .categories import (
-    BusinessConfig, EmailConfig, WhatsAppConfig, SMSConfig, 
-    PDFConfig, DatabaseConfig, BackupConfig, SecurityConfig
-)
 
 logger = logging.getLogger(__name__)
 
+# Category -> (module in config.categories, class name), in schema order.
+# Category modules are imported on first use rather than with this package.
+_CATEGORY_MODULES = {
+    ConfigCategory.BUSINESS: ('business', 'BusinessConfig'),
+    ConfigCategory.EMAIL: ('email', 'EmailConfig'),
+    ConfigCategory.WHATSAPP: ('whatsapp', 'WhatsAppConfig'),
+    ConfigCategory.SMS: ('sms', 'SMSConfig'),
+    ConfigCategory.PDF: ('pdf', 'PDFConfig'),
+    ConfigCategory.DATABASE: ('database', 'DatabaseConfig'),
+    ConfigCategory.BACKUP: ('backup', 'BackupConfig'),
+    ConfigCategory.SECURITY: ('security', 'SecurityConfig'),
+}
+
+
+# Display name per category for the settings UI
+_CATEGORY_DISPLAY_NAMES = MappingProxyType({
+    ConfigCategory.GENERAL: "General Settings",
+    ConfigCategory.BUSINESS: "Business Information",
+    ConfigCategory.WHATSAPP: "WhatsApp Integration",
+    ConfigCategory.EMAIL: "Email Configuration",
+    ConfigCategory.SMS: "SMS Configuration",
+    ConfigCategory.PDF: "PDF Settings",
+    ConfigCategory.DATABASE: "Database Configuration",
+    ConfigCategory.BACKUP: "Backup Settings",
+    ConfigCategory.SECURITY: "Security Settings"
+})
+
+# Icon per category for the settings UI
+_CATEGORY_ICONS = MappingProxyType({
+    ConfigCategory.GENERAL: "⚙️",
+    ConfigCategory.BUSINESS: "🏢",
+    ConfigCategory.WHATSAPP: "📱",
+    ConfigCategory.EMAIL: "📧",
+    ConfigCategory.SMS: "💬",
+    ConfigCategory.PDF: "📄",
+    ConfigCategory.DATABASE: "🗄️",
+    ConfigCategory.BACKUP: "💾",
+    ConfigCategory.SECURITY: "🔒"
+})
+
+# Description per category for the settings UI
+_CATEGORY_DESCRIPTIONS = MappingProxyType({
+    ConfigCategory.GENERAL: "General application settings and preferences",
+    ConfigCategory.BUSINESS: "Company information and branding settings",
+    ConfigCategory.WHATSAPP: "WhatsApp Business API integration settings",
+    ConfigCategory.EMAIL: "Email server and messaging configuration",
+    ConfigCategory.SMS: "SMS service provider and messaging settings",
+    ConfigCategory.PDF: "PDF generation and formatting settings",
+    ConfigCategory.DATABASE: "Database connection and performance settings",
+    ConfigCategory.BACKUP: "Automated backup and recovery settings",
+    ConfigCategory.SECURITY: "Security policies and authentication settings"
+})
+
+
+def _load_category_class(category: ConfigCategory):
+    """Import the module defining a category and return its config class"""
+    module_name, class_name = _CATEGORY_MODULES[category]
+    module = importlib.import_module(f'{__package__}.categories.{module_name}')
+    return getattr(module, class_name)
+
 
 class ConfigManager:
     """Manages application configuration with validation and categorization"""
     
+    # The schema is static, so it and its derived lookups are built once per process:
+    # per category on first use, and in full the first time the whole schema is needed
+    _SCHEMA_CACHE: Optional[Dict[str, ConfigField]] = None
+    _SCHEMA_VIEW: Optional[Mapping[str, ConfigField]] = None
+    _REQUIRED_KEYS: Tuple[str, ...] = ()
+    _SENSITIVE_KEYS: FrozenSet[str] = frozenset()
+    _DEFAULT_VALUES: Dict[str, Any] = {}
+    _FIELD_VALIDATORS: Dict[str, Callable[[Any], tuple]] = {}
+    _CATEGORIES_SORTED: Tuple[ConfigCategory, ...] = tuple(sorted(_CATEGORY_MODULES, key=lambda x: x.value))
+    _FIELDS_BY_CATEGORY: Dict[ConfigCategory, Tuple[ConfigField, ...]] = {}
+    
     def __init__(self):
-        self._config_schema = self._initialize_schema()
         self._validator = ConfigValidator()
     
+    def _schema(self) -> Dict[str, ConfigField]:
+        """The full schema, loading every category the first time it is needed"""
+        if ConfigManager._SCHEMA_CACHE is None:
+            schema = self._initialize_schema()
+            ConfigManager._REQUIRED_KEYS = tuple(key for key, field in schema.items() if field.is_required)
+            ConfigManager._SENSITIVE_KEYS = frozenset(
+                key for key, field in schema.items() if field.is_sensitive
+            )
+            ConfigManager._DEFAULT_VALUES = {
+                key: field.value if field.default_value is None else field.default_value
+                for key, field in schema.items()
+            }
+            # Each field's checks are compiled once instead of dispatched on every validation
+            compile_field = self._validator.compile_field
+            ConfigManager._FIELD_VALIDATORS = {
+                key: compile_field(field) for key, field in schema.items()
+            }
+            ConfigManager._SCHEMA_VIEW = MappingProxyType(schema)
+            # Published last so other instances never see a partly built cache
+            ConfigManager._SCHEMA_CACHE = schema
+        return ConfigManager._SCHEMA_CACHE
+    
+    @staticmethod
+    def _category_fields(category: ConfigCategory) -> Tuple[ConfigField, ...]:
+        """Fields of one category, importing its module on first use"""
+        fields = ConfigManager._FIELDS_BY_CATEGORY.get(category)
+        if fields is None:
+            if category not in _CATEGORY_MODULES:
+                return ()
+            fields = tuple(_load_category_class(category).get_fields())
+            ConfigManager._FIELDS_BY_CATEGORY[category] = fields
+        return fields
+    
     def _initialize_schema(self) -> Dict[str, ConfigField]:
         """Initialize the configuration schema with all available options"""
-        schema = {}
-        
-        # Load all configuration categories
-        categories = [
-            BusinessConfig,
-            EmailConfig,
-            WhatsAppConfig,
-            SMSConfig,
-            PDFConfig,
-            DatabaseConfig,
-            BackupConfig,
-            SecurityConfig
-        ]
-        
         # Build schema from all category fields
-        for category_class in categories:
-            fields = category_class.get_fields()
-            for field in fields:
-                schema[field.key] = field
-        
-        return schema
+        category_fields = self._category_fields
+        return {field.key: field
+                for category in _CATEGORY_MODULES
+                for field in category_fields(category)}
     
-    def get_schema(self) -> Dict[str, ConfigField]:
-        """Get the complete configuration schema"""
-        return self._config_schema.copy()
+    def get_schema(self) -> Mapping[str, ConfigField]:
+        """Get the complete configuration schema as a read-only view"""
+        self._schema()
+        return ConfigManager._SCHEMA_VIEW
     
-    def get_config_schema(self) -> Dict[str, ConfigField]:
+    def get_config_schema(self) -> Mapping[str, ConfigField]:
         """Get the complete configuration schema (alias for get_schema for backward compatibility)"""
         return self.get_schema()
     
-    def get_categories(self) -> List[ConfigCategory]:
+    def get_categories(self) -> Tuple[ConfigCategory, ...]:
         """Get all available configuration categories"""
-        categories = set()
-        for field in self._config_schema.values():
-            categories.add(field.category)
-        return sorted(categories, key=lambda x: x.value)
+        return self._CATEGORIES_SORTED
     
-    def get_fields_by_category(self, category: ConfigCategory) -> List[ConfigField]:
+    def get_fields_by_category(self, category: ConfigCategory) -> Tuple[ConfigField, ...]:
         """Get all configuration fields for a specific category"""
-        return [
-            field for field in self._config_schema.values()
-            if field.category == category
-        ]
+        return self._category_fields(category)
     
     def get_field(self, key: str) -> Optional[ConfigField]:
         """Get a specific configuration field by key"""
-        return self._config_schema.get(key)
+        return self._schema().get(key)
     
     def validate_config(self, key: str, value: Any) -> tuple[bool, Optional[str]]:
         """Validate a configuration value"""
-        field = self.get_field(key)
-        if not field:
+        self._schema()
+        validator = self._FIELD_VALIDATORS.get(key)
+        if validator is None:
             return False, f"Unknown configuration key: {key}"
         
-        # Check if required field is empty
-        if field.is_required and (value is None or str(value).strip() == ""):
-            return False, f"Field '{key}' is required and cannot be empty"
-        
-        # Validate using the field's type and rules
-        return self._validator.validate_config_value(
-            field.type, 
-            value, 
-            field.validation_rules
-        )
+        # Required check, type and rules are all part of the field's compiled validator
+        return validator(value)
     
     def get_default_values(self) -> Dict[str, Any]:
         """Get default values for all configuration fields"""
-        defaults = {}
-        for key, field in self._config_schema.items():
-            defaults[key] = field.value if field.default_value is None else field.default_value
-        return defaults
-    
-    def get_required_fields(self) -> List[str]:
-        """Get list of required configuration field keys"""
-        return [
-            key for key, field in self._config_schema.items()
-            if field.is_required
-        ]
-    
-    def get_sensitive_fields(self) -> Set[str]:
+        self._schema()
+        return ConfigManager._DEFAULT_VALUES.copy()
+    
+    def get_required_fields(self) -> Tuple[str, ...]:
+        """Get the required configuration field keys"""
+        self._schema()
+        return self._REQUIRED_KEYS
+    
+    def get_sensitive_fields(self) -> FrozenSet[str]:
         """Get set of sensitive configuration field keys"""
-        return {
-            key for key, field in self._config_schema.items()
-            if field.is_sensitive
-        }
+        self._schema()
+        return self._SENSITIVE_KEYS
     
     def is_sensitive_field(self, key: str) -> bool:
         """Check if a configuration field is sensitive"""
-        field = self.get_field(key)
-        return field.is_sensitive if field else False
+        return is_sensitive_key(key)
     
     def get_category_display_name(self, category: ConfigCategory) -> str:
         """Get display name for a configuration category"""
-        display_names = {
-            ConfigCategory.GENERAL: "General Settings",
-            ConfigCategory.BUSINESS: "Business Information",
-            ConfigCategory.WHATSAPP: "WhatsApp Integration",
-            ConfigCategory.EMAIL: "Email Configuration",
-            ConfigCategory.SMS: "SMS Configuration",
-            ConfigCategory.PDF: "PDF Settings",
-            ConfigCategory.DATABASE: "Database Configuration",
-            ConfigCategory.BACKUP: "Backup Settings",
-            ConfigCategory.SECURITY: "Security Settings"
-        }
-        return display_names.get(category, category.value.title())
+        return _CATEGORY_DISPLAY_NAMES.get(category, category.value.title())
     
     def get_category_icon(self, category: ConfigCategory) -> str:
         """Get icon for a configuration category"""
-        icons = {
-            ConfigCategory.GENERAL: "⚙️",
-            ConfigCategory.BUSINESS: "🏢",
-            ConfigCategory.WHATSAPP: "📱",
-            ConfigCategory.EMAIL: "📧",
-            ConfigCategory.SMS: "💬",
-            ConfigCategory.PDF: "📄",
-            ConfigCategory.DATABASE: "🗄️",
-            ConfigCategory.BACKUP: "💾",
-            ConfigCategory.SECURITY: "🔒"
-        }
-        return icons.get(category, "⚙️")
+        return _CATEGORY_ICONS.get(category, "⚙️")
     
     def get_category_description(self, category: ConfigCategory) -> str:
         """Get description for a configuration category"""
-        descriptions = {
-            ConfigCategory.GENERAL: "General application settings and preferences",
-            ConfigCategory.BUSINESS: "Company information and branding settings",
-            ConfigCategory.WHATSAPP: "WhatsApp Business API integration settings",
-            ConfigCategory.EMAIL: "Email server and messaging configuration",
-            ConfigCategory.SMS: "SMS service provider and messaging settings",
-            ConfigCategory.PDF: "PDF generation and formatting settings",
-            ConfigCategory.DATABASE: "Database connection and performance settings",
-            ConfigCategory.BACKUP: "Automated backup and recovery settings",
-            ConfigCategory.SECURITY: "Security policies and authentication settings"
-        }
-        return descriptions.get(category, "Configuration settings")
-    
-    def validate_batch_configs(self, configs: Dict[str, Any]) -> Dict[str, List[str]]:
-        """Validate multiple configuration values at once"""
-        results = {
-            'valid': [],
-            'invalid': [],
-            'errors': {}
-        }
+        return _CATEGORY_DESCRIPTIONS.get(category, "Configuration settings")
+    
+    def validate_batch_configs(self, configs: Dict[str, Any],
+                               collect_valid: bool = True) -> Dict[str, List[str]]:
+        """Validate multiple configuration values at once
+        
+        Pass collect_valid=False when only the failures are needed; 'valid' is then left empty.
+        """
+        valid, invalid, errors = [], [], {}
+        
+        # Hoist lookups out of the per-key loop
+        self._schema()
+        validator_for = self._FIELD_VALIDATORS.get
         
         for key, value in configs.items():
-            is_valid, error_message = self.validate_config(key, value)
-            if is_valid:
-                results['valid'].append(key)
+            validator = validator_for(key)
+            if validator is None:
+                error_message = f"Unknown configuration key: {key}"
             else:
-                results['invalid'].append(key)
-                results['errors'][key] = error_message
+                is_valid, error_message = validator(value)
+                if is_valid:
+                    if collect_valid:
+                        valid.append(key)
+                    continue
+            invalid.append(key)
+            errors[key] = error_message
         
-        return results
+        return {
+            'valid': valid,
+            'invalid': invalid,
+            'errors': errors
+        }
+
+
+@lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """Get the shared ConfigManager instance"""
+    return ConfigManager()
+
+
+def is_sensitive_key(key: str) -> bool:
+    """Check if a configuration key is sensitive without creating a ConfigManager
+    
+    A single frozenset lookup once the schema is loaded, so it is cheap enough
+    for log scrubbing.
+    """
+    if ConfigManager._SCHEMA_CACHE is None:
+        get_config_manager()._schema()
+    return key in ConfigManager._SENSITIVE_KEYS
@@ -0,0 +1,65 @@
+"""
+Configuration schema loader for Himanshi Travels
+
+Field metadata for every category lives in schema.json next to this module.
+"""
+
+import os
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+from .types import ConfigField, ConfigType, ConfigCategory
+
+SCHEMA_FILE = os.path.join(os.path.dirname(__file__), 'schema.json')
+
+# Keys every field entry must have, and every key a field entry may have
+_REQUIRED_FIELD_KEYS = ('key', 'value', 'type', 'description')
+_ALLOWED_FIELD_KEYS = frozenset(_REQUIRED_FIELD_KEYS) | {
+    'help_text', 'is_sensitive', 'is_required', 'default_value', 'validation_rules'
+}
+
+
+def _check_document(document: Any) -> None:
+    """Reject a malformed schema document with a message naming the bad entry"""
+    if not isinstance(document, dict):
+        raise ValueError(f"{SCHEMA_FILE}: expected an object of categories")
+
+    for category, specs in document.items():
+        try:
+            ConfigCategory(category)
+        except ValueError:
+            raise ValueError(f"{SCHEMA_FILE}: unknown category '{category}'") from None
+        if not isinstance(specs, list):
+            raise ValueError(f"{SCHEMA_FILE}: category '{category}' must be a list of fields")
+
+        for index, spec in enumerate(specs):
+            where = f"{SCHEMA_FILE}: {category}[{index}]"
+            if not isinstance(spec, dict):
+                raise ValueError(f"{where}: field must be an object")
+            missing = [name for name in _REQUIRED_FIELD_KEYS if name not in spec]
+            if missing:
+                raise ValueError(f"{where}: missing {', '.join(missing)}")
+            unknown = spec.keys() - _ALLOWED_FIELD_KEYS
+            if unknown:
+                raise ValueError(f"{where}: unknown keys {', '.join(sorted(unknown))}")
+            try:
+                ConfigType(spec['type'])
+            except ValueError:
+                raise ValueError(f"{where}: unknown type '{spec['type']}'") from None
+
+
+@lru_cache(maxsize=1)
+def load_schema_document() -> Dict[str, List[Dict[str, Any]]]:
+    """Read and check schema.json; the file is only read once per process"""
+    with open(SCHEMA_FILE, encoding='utf-8') as f:
+        document = json.load(f)
+    _check_document(document)
+    return document
+
+
+def load_category_fields(category: ConfigCategory) -> Tuple[ConfigField, ...]:
+    """Build the ConfigFields declared for one category"""
+    return tuple(
+        ConfigField(**{**spec, 'type': ConfigType(spec['type']), 'category': category})
+        for spec in load_schema_document().get(category.value, ())
+    )
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 
-class ConfigType(Enum):
+class ConfigType(str, Enum):
     """Configuration value types"""
     STRING = "string"
     BOOLEAN = "boolean"
@@ -18,7 +18,7 @@ class ConfigType(Enum):
     PHONE = "phone"
 
 
-class ConfigCategory(Enum):
+class ConfigCategory(str, Enum):
     """Configuration categories"""
     GENERAL = "general"
     BUSINESS = "business"
@@ -31,9 +31,9 @@ class ConfigCategory(Enum):
     SECURITY = "security"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConfigField:
-    """Represents a configuration field with metadata"""
+    """Represents a configuration field with metadata (immutable; shared by the cached schema)"""
     key: str
     value: Any
     type: ConfigType
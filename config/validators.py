@@ -4,11 +4,47 @@ Configuration validators for Himanshi Travels
 
 import re
 import logging
-from typing import Any, Dict, Optional, List
-from .types import ConfigType
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, List
+from .types import ConfigType, ConfigField
 
 logger = logging.getLogger(__name__)
 
+# Format patterns, compiled once at import
+GSTIN_PATTERN = re.compile(r'^\d{2}[A-Z]{5}\d{4}[A-Z][A-Z\d]Z[A-Z\d]$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+
+# Accepted spellings of a boolean; the common casings are listed so most values skip .lower()
+_BOOLEAN_STRINGS_LOWER = frozenset({'true', 'false', '1', '0', 'yes', 'no'})
+_BOOLEAN_STRINGS = _BOOLEAN_STRINGS_LOWER | {
+    spelling.title() for spelling in _BOOLEAN_STRINGS_LOWER
+} | {spelling.upper() for spelling in _BOOLEAN_STRINGS_LOWER}
+
+
+# Shared result for values that pass validation
+_VALID = (True, None)
+
+
+def _is_blank(value: Any) -> bool:
+    """True for None or a whitespace-only string; other types are never blank"""
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _always_valid(value: Any) -> tuple[bool, Optional[str]]:
+    return _VALID
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a custom-rule pattern string, reusing earlier compilations"""
+    return re.compile(pattern)
+
+
+def _as_str(value: Any) -> str:
+    """String form of a value for format checks (None becomes empty)"""
+    return str(value) if value is not None else ""
+
 
 class ConfigValidator:
     """Validates configuration values according to their types and rules"""
@@ -19,8 +55,7 @@ class ConfigValidator:
         if not value:  # Allow empty values for non-required fields
             return True, None
             
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, value):
+        if not _EMAIL_RE.match(value):
             return False, "Invalid email format"
         return True, None
     
@@ -30,8 +65,7 @@ class ConfigValidator:
         if not value:  # Allow empty values for non-required fields
             return True, None
             
-        url_pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-        if not re.match(url_pattern, value):
+        if not _URL_RE.match(value):
             return False, "Invalid URL format (must start with http:// or https://)"
         return True, None
     
@@ -41,9 +75,10 @@ class ConfigValidator:
         if not value:  # Allow empty values for non-required fields
             return True, None
             
-        # Remove all non-digit characters for validation
-        digits_only = re.sub(r'\D', '', value)
-        if len(digits_only) < 10 or len(digits_only) > 15:
+        # Only the digits count; separators such as spaces, dashes and + are ignored
+        # (str.isdecimal matches the same characters as the regex \d)
+        digit_count = sum(map(str.isdecimal, value))
+        if digit_count < 10 or digit_count > 15:
             return False, "Phone number must be between 10-15 digits"
         return True, None
     
@@ -53,8 +88,7 @@ class ConfigValidator:
         if not value:
             return True, None
             
-        gstin_pattern = r'^\d{2}[A-Z]{5}\d{4}[A-Z][A-Z\d]Z[A-Z\d]$'
-        if not re.match(gstin_pattern, value):
+        if not GSTIN_PATTERN.match(value):
             return False, "Invalid GSTIN format"
         return True, None
     
@@ -73,51 +107,99 @@ class ConfigValidator:
         if isinstance(value, bool):
             return True, None
         if isinstance(value, str):
-            if value.lower() in ('true', 'false', '1', '0', 'yes', 'no'):
+            if value in _BOOLEAN_STRINGS or value.lower() in _BOOLEAN_STRINGS_LOWER:
                 return True, None
         return False, "Value must be true or false"
     
+    @staticmethod
+    def get_validator_for_type(config_type: ConfigType) -> Callable[[Any, Optional[Dict]], tuple[bool, Optional[str]]]:
+        """Return the validator for a config type, called as validator(value, validation_rules)"""
+        return _TYPE_VALIDATORS.get(config_type, ConfigValidator._validate_text)
+    
     @staticmethod
     def validate_config_value(config_type: ConfigType, value: Any, validation_rules: Optional[Dict] = None) -> tuple[bool, Optional[str]]:
         """Validate a configuration value based on its type and rules"""
-        
-        # Convert value to string for validation
-        str_value = str(value) if value is not None else ""
-        
-        # Type-specific validation
-        if config_type == ConfigType.EMAIL:
-            return ConfigValidator.validate_email(str_value)
-        elif config_type == ConfigType.URL:
-            return ConfigValidator.validate_url(str_value)
-        elif config_type == ConfigType.PHONE:
-            return ConfigValidator.validate_phone(str_value)
-        elif config_type == ConfigType.NUMBER:
-            return ConfigValidator.validate_number(value)
-        elif config_type == ConfigType.BOOLEAN:
-            return ConfigValidator.validate_boolean(value)
-        
-        # Custom validation rules
+        return ConfigValidator.get_validator_for_type(config_type)(value, validation_rules)
+    
+    @staticmethod
+    def _validate_text(value: Any, validation_rules: Optional[Dict] = None) -> tuple[bool, Optional[str]]:
+        """Validate a string or password value against its custom rules, if any"""
         if validation_rules:
-            return ConfigValidator._validate_custom_rules(str_value, validation_rules)
-        
+            return ConfigValidator._validate_custom_rules(_as_str(value), validation_rules)
         return True, None
     
     @staticmethod
     def _validate_custom_rules(str_value: str, validation_rules: Dict) -> tuple[bool, Optional[str]]:
         """Validate custom validation rules"""
-        if 'pattern' in validation_rules:
-            pattern = validation_rules['pattern']
-            if pattern == r'^\d{2}[A-Z]{5}\d{4}[A-Z][A-Z\d]Z[A-Z\d]$':
-                return ConfigValidator.validate_gstin(str_value)
-            elif not re.match(pattern, str_value):
+        return ConfigValidator._compile_rules(validation_rules)(str_value)
+    
+    @staticmethod
+    def _compile_rules(validation_rules: Dict) -> Callable[[Any], tuple[bool, Optional[str]]]:
+        """Build a check for a field's custom rules with the pattern and limits bound up front"""
+        # A named format (e.g. 'gstin') uses its dedicated validator in place of the other rules
+        format_name = validation_rules.get('format')
+        if format_name is not None:
+            validate_format = _FORMAT_VALIDATORS.get(format_name)
+            if validate_format is None:
+                raise ValueError(f"Unknown validation format: {format_name}")
+            return lambda value: validate_format(_as_str(value))
+        
+        pattern = _compile_pattern(validation_rules['pattern']) if 'pattern' in validation_rules else None
+        
+        min_length = validation_rules.get('min_length')
+        max_length = validation_rules.get('max_length')
+        
+        def check(value: Any) -> tuple[bool, Optional[str]]:
+            str_value = _as_str(value)
+            if pattern is not None and not pattern.match(str_value):
                 return False, "Value does not match required pattern"
+            if min_length is not None and len(str_value) < min_length:
+                return False, f"Minimum length is {min_length}"
+            if max_length is not None and len(str_value) > max_length:
+                return False, f"Maximum length is {max_length}"
+            return _VALID
         
-        if 'min_length' in validation_rules:
-            if len(str_value) < validation_rules['min_length']:
-                return False, f"Minimum length is {validation_rules['min_length']}"
+        return check
+    
+    @staticmethod
+    def compile_field(field: ConfigField) -> Callable[[Any], tuple[bool, Optional[str]]]:
+        """Build a validator for one field, called as validator(value)
         
-        if 'max_length' in validation_rules:
-            if len(str_value) > validation_rules['max_length']:
-                return False, f"Maximum length is {validation_rules['max_length']}"
+        The required check, type dispatch and custom rules are all resolved here,
+        so fields with nothing to check get a validator that only returns success.
+        """
+        check = _TYPE_VALIDATORS.get(field.type)
+        if check is None and field.validation_rules:
+            check = ConfigValidator._compile_rules(field.validation_rules)
         
-        return True, None
+        if not field.is_required:
+            return check or _always_valid
+        
+        required_error = (False, f"Field '{field.key}' is required and cannot be empty")
+        check = check or _always_valid
+        
+        def validate(value: Any) -> tuple[bool, Optional[str]]:
+            if _is_blank(value):
+                return required_error
+            return check(value)
+        
+        return validate
+
+
+# Validator per config type. Format-checked types ignore custom rules;
+# STRING and PASSWORD fall back to ConfigValidator._validate_text.
+_TYPE_VALIDATORS = {
+    ConfigType.EMAIL: lambda value, validation_rules=None: ConfigValidator.validate_email(_as_str(value)),
+    ConfigType.URL: lambda value, validation_rules=None: ConfigValidator.validate_url(_as_str(value)),
+    ConfigType.PHONE: lambda value, validation_rules=None: ConfigValidator.validate_phone(_as_str(value)),
+    ConfigType.NUMBER: lambda value, validation_rules=None: ConfigValidator.validate_number(value),
+    ConfigType.BOOLEAN: lambda value, validation_rules=None: ConfigValidator.validate_boolean(value),
+}
+
+# Validator per named format, selected with validation_rules={'format': name}
+_FORMAT_VALIDATORS = {
+    'gstin': ConfigValidator.validate_gstin,
+    'email': ConfigValidator.validate_email,
+    'url': ConfigValidator.validate_url,
+    'phone': ConfigValidator.validate_phone,
+}
@@ -10,20 +10,20 @@ import logging
 from typing import Dict, List, Any, Optional
 
 # Import the new modular config system
-from config import ConfigManager as ModularConfigManager
+from config import get_config_manager
 from config import ConfigType, ConfigCategory, ConfigField
 
 logger = logging.getLogger(__name__)
 
 # Create the global config manager instance for backward compatibility
-config_manager = ModularConfigManager()
+config_manager = get_config_manager()
 
 # Backward compatibility class
 class ConfigManager:
     """Legacy ConfigManager wrapper for backward compatibility"""
     
     def __init__(self):
-        self._modular_manager = ModularConfigManager()
+        self._modular_manager = get_config_manager()
     
     def get_categories(self):
         """Get all available configuration categories"""
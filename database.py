@@ -2,21 +2,127 @@
 Database operations for Himanshi Travels application
 """
 
+import os
+import time
+import queue
+import base64
 import sqlite3
-from typing import List, Dict, Any, Optional, Tuple
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 from dynamic_config import DATABASE_FILE
 
-
-def get_db_connection():
-    """Get database connection with row factory"""
-    con = sqlite3.connect(DATABASE_FILE)
+logger = logging.getLogger(__name__)
+
+# Booking columns covered by the full-text search index, and the shortest
+# query it can answer (the trigram tokenizer matches substrings of 3+ characters)
+_SEARCH_COLUMNS = ('name', 'email', 'phone', 'hotel_name', 'operator_name',
+                   'from_journey', 'to_journey', 'vehicle_number')
+_FTS_MIN_QUERY_LENGTH = 3
+
+# Most ids bound into one IN (...) list; SQLite before 3.32 allows 999 parameters
+_MAX_IN_PARAMS = 999
+
+# Columns returned by search_bookings, with NULLs turned into '' by SQLite
+_SEARCH_RESULT_COLUMNS = ('name', 'email', 'phone', 'booking_type', 'base_amount', 'gst', 'total',
+                          'date', 'hotel_name', 'hotel_city', 'operator_name', 'from_journey',
+                          'to_journey', 'vehicle_number', 'service_date', 'service_time',
+                          'is_group_booking')
+_SEARCH_RESULT_KEYS = ('id',) + _SEARCH_RESULT_COLUMNS
+_SEARCH_RESULT_SELECT = ', '.join(f"COALESCE({column}, '') AS {column}"
+                                  for column in _SEARCH_RESULT_COLUMNS)
+
+
+# Match counts per (query, booking_type) search, reused while paging through
+# the same results. Booking writes here clear them; the TTL bounds how long a
+# change made elsewhere (another process, a restore) can go unnoticed
+SEARCH_COUNT_TTL = 30.0
+_SEARCH_COUNT_CACHE_SIZE = 256
+_search_counts: Dict[Tuple[str, str], Tuple[float, int]] = {}
+_search_counts_generation = 0
+_search_counts_lock = threading.Lock()
+
+# Connections are kept open between calls; up to DB_POOL_SIZE idle ones are
+# held for reuse (the dev server runs every request on a new thread)
+DB_POOL_SIZE = int(os.environ.get('HT_DB_POOL_SIZE', 8))
+_connection_pool: 'queue.LifoQueue[sqlite3.Connection]' = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+
+
+def _open_connection() -> sqlite3.Connection:
+    """Open a connection with row factory and the per-connection PRAGMAs"""
+    # Pooled connections move between threads, but only one uses them at a time.
+    # The statement cache is sized so search's generated filter variants don't
+    # push the fixed queries out
+    con = sqlite3.connect(DATABASE_FILE, check_same_thread=False, cached_statements=256)
     con.row_factory = sqlite3.Row
+    # synchronous and foreign_keys are per-connection; WAL mode itself is set by init_db
+    con.execute('PRAGMA synchronous=NORMAL')
+    con.execute('PRAGMA foreign_keys=ON')
+    con.execute('PRAGMA temp_store=MEMORY')
+    con.execute('PRAGMA cache_size=-16384')  # up to 16 MiB of page cache
+    con.execute('PRAGMA mmap_size=268435456')
     return con
 
 
+@contextmanager
+def get_db_connection() -> Iterator[sqlite3.Connection]:
+    """Borrow a pooled database connection for one transaction
+    
+    `with get_db_connection() as con:` commits (or rolls back) the enclosed
+    transaction, then hands the connection back to the pool.
+    """
+    try:
+        con = _connection_pool.get_nowait()
+    except queue.Empty:
+        con = _open_connection()
+    try:
+        with con:
+            yield con
+    finally:
+        try:
+            _connection_pool.put_nowait(con)
+        except queue.Full:
+            con.close()
+
+
+def invalidate_search_counts():
+    """Forget the cached search match counts; call after bookings change"""
+    global _search_counts_generation
+    with _search_counts_lock:
+        _search_counts.clear()
+        _search_counts_generation += 1
+
+
+def _cached_search_count(key: Tuple[str, str]) -> Optional[int]:
+    """A cached match count for a search that has not expired, else None"""
+    with _search_counts_lock:
+        entry = _search_counts.get(key)
+    if entry and time.monotonic() - entry[0] < SEARCH_COUNT_TTL:
+        return entry[1]
+    return None
+
+
+def _store_search_count(key: Tuple[str, str], count: int, generation: int):
+    """Cache a match count, unless bookings changed since counting started"""
+    with _search_counts_lock:
+        if generation != _search_counts_generation:
+            return
+        if len(_search_counts) >= _SEARCH_COUNT_CACHE_SIZE:
+            _search_counts.clear()
+        _search_counts[key] = (time.monotonic(), count)
+
+
 def init_db():
     """Initialize database with required tables and indexes"""
     with sqlite3.connect(DATABASE_FILE) as con:
+        # WAL is stored in the file, so this only needs doing once: readers then
+        # run alongside the writer and commits need fewer fsyncs
+        con.execute('PRAGMA journal_mode=WAL')
+        
+        # sqlite3 leaves DDL in autocommit, so open the transaction explicitly:
+        # the schema setup below then commits once instead of once per statement
+        con.execute('BEGIN')
         cur = con.cursor()
         
         # Create main bookings table
@@ -75,19 +181,29 @@ def init_db():
             ('to_journey_country', 'TEXT')
         ]
         
+        existing_columns = {row[1] for row in cur.execute('PRAGMA table_info(bookings)')}
         for column_name, column_type in additional_columns:
-            try:
+            if column_name not in existing_columns:
                 cur.execute(f'ALTER TABLE bookings ADD COLUMN {column_name} {column_type}')
-            except sqlite3.OperationalError:
-                pass  # Column already exists
+        
+        # The planner needs statistics for the composite type/date index once it exists
+        has_type_date_index = cur.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_bookings_type_date_id'"
+        ).fetchone() is not None
         
         # Create indexes for better search performance
         indexes = [
             'CREATE INDEX IF NOT EXISTS idx_bookings_name ON bookings(name)',
             'CREATE INDEX IF NOT EXISTS idx_bookings_email ON bookings(email)',
             'CREATE INDEX IF NOT EXISTS idx_bookings_phone ON bookings(phone)',
-            'CREATE INDEX IF NOT EXISTS idx_bookings_type ON bookings(booking_type)',
-            'CREATE INDEX IF NOT EXISTS idx_bookings_date ON bookings(date DESC)',
+            # Type filter + date ordering in one index scan; also serves type-only lookups.
+            # Date indexes are ascending: scanned backwards they give the search order
+            # date DESC, id DESC (the rowid is every index's implicit last column)
+            'CREATE INDEX IF NOT EXISTS idx_bookings_type_date_id ON bookings(booking_type, date)',
+            'DROP INDEX IF EXISTS idx_bookings_type',
+            'DROP INDEX IF EXISTS idx_bookings_type_date',
+            'CREATE INDEX IF NOT EXISTS idx_bookings_date_id ON bookings(date)',
+            'DROP INDEX IF EXISTS idx_bookings_date',
             'CREATE INDEX IF NOT EXISTS idx_bookings_hotel_name ON bookings(hotel_name)',
             'CREATE INDEX IF NOT EXISTS idx_bookings_operator ON bookings(operator_name)',
             'CREATE INDEX IF NOT EXISTS idx_booking_customers_booking_id ON booking_customers(booking_id)',
@@ -100,53 +216,111 @@ def init_db():
             except sqlite3.OperationalError:
                 pass  # Index might already exist
         
+        if not has_type_date_index:
+            cur.execute('ANALYZE')
+        
+        _create_search_index(cur)
+        
         con.commit()
         
         # Initialize default configuration values
         initialize_default_config()
 
 
+def _create_search_index(cur: sqlite3.Cursor):
+    """Create the bookings_fts full-text index and the triggers that keep it in sync
+    
+    Needs SQLite's FTS5 trigram tokenizer (3.34+); without it, search keeps using LIKE.
+    """
+    if cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bookings_fts'").fetchone():
+        return
+    
+    columns = ', '.join(_SEARCH_COLUMNS)
+    new_values = ', '.join(f'new.{column}' for column in _SEARCH_COLUMNS)
+    old_values = ', '.join(f'old.{column}' for column in _SEARCH_COLUMNS)
+    try:
+        cur.execute(f"""CREATE VIRTUAL TABLE bookings_fts USING fts5({columns},
+                        content='bookings', content_rowid='id', tokenize='trigram')""")
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Full-text booking search unavailable, using LIKE search: {e}")
+        return
+    
+    cur.execute(f"""CREATE TRIGGER IF NOT EXISTS bookings_fts_insert AFTER INSERT ON bookings BEGIN
+                        INSERT INTO bookings_fts (rowid, {columns}) VALUES (new.id, {new_values});
+                    END""")
+    cur.execute(f"""CREATE TRIGGER IF NOT EXISTS bookings_fts_delete AFTER DELETE ON bookings BEGIN
+                        INSERT INTO bookings_fts (bookings_fts, rowid, {columns})
+                        VALUES ('delete', old.id, {old_values});
+                    END""")
+    cur.execute(f"""CREATE TRIGGER IF NOT EXISTS bookings_fts_update AFTER UPDATE ON bookings BEGIN
+                        INSERT INTO bookings_fts (bookings_fts, rowid, {columns})
+                        VALUES ('delete', old.id, {old_values});
+                        INSERT INTO bookings_fts (rowid, {columns}) VALUES (new.id, {new_values});
+                    END""")
+    
+    # Index the bookings that already exist
+    cur.execute("INSERT INTO bookings_fts (bookings_fts) VALUES ('rebuild')")
+
+
+def _insert_booking(cur: sqlite3.Cursor, booking_data: Dict[str, Any]) -> int:
+    """Insert a booking row using an open cursor and return its ID"""
+    cur.execute('''INSERT INTO bookings (name, email, phone, booking_type, base_amount, gst, total, date,
+                hotel_name, hotel_city, operator_name, from_journey, to_journey, vehicle_number, 
+                service_date, service_time, is_group_booking, customer_address, apply_gst, 
+                hotel_country, from_journey_country, to_journey_country)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                (booking_data['name'], booking_data.get('email') or None, booking_data['phone'], 
+                 booking_data['booking_type'], booking_data['base_amount'], booking_data['gst'], 
+                 booking_data['total'], booking_data['date'], booking_data.get('hotel_name'),
+                 booking_data.get('hotel_city'), booking_data.get('operator_name'),
+                 booking_data.get('from_journey'), booking_data.get('to_journey'),
+                 booking_data.get('vehicle_number'), booking_data.get('service_date'),
+                 booking_data.get('service_time'), booking_data.get('is_group_booking', 0),
+                 booking_data.get('customer_address'), booking_data.get('apply_gst', 1),
+                 booking_data.get('hotel_country'), booking_data.get('from_journey_country'),
+                 booking_data.get('to_journey_country')))
+    return cur.lastrowid
+
+
+def _insert_booking_customers(cur: sqlite3.Cursor, booking_id: int, customers: List[Dict[str, Any]]):
+    """Insert all customers of a group booking in one batch using an open cursor"""
+    cur.executemany('''INSERT INTO booking_customers (booking_id, customer_name, customer_email, 
+                    customer_phone, seat_room_number, customer_amount)
+                    VALUES (?, ?, ?, ?, ?, ?)''',
+                    [(booking_id, customer['name'], customer['email'], customer['phone'],
+                      customer['seat_room'], float(customer['amount']))
+                     for customer in customers])
+
+
 def create_booking(booking_data: Dict[str, Any]) -> int:
     """Create a new booking and return the booking ID"""
     with get_db_connection() as con:
         cur = con.cursor()
-        
-        cur.execute('''INSERT INTO bookings (name, email, phone, booking_type, base_amount, gst, total, date,
-                    hotel_name, hotel_city, operator_name, from_journey, to_journey, vehicle_number, 
-                    service_date, service_time, is_group_booking, customer_address, apply_gst, 
-                    hotel_country, from_journey_country, to_journey_country)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                    (booking_data['name'], booking_data.get('email') or None, booking_data['phone'], 
-                     booking_data['booking_type'], booking_data['base_amount'], booking_data['gst'], 
-                     booking_data['total'], booking_data['date'], booking_data.get('hotel_name'),
-                     booking_data.get('hotel_city'), booking_data.get('operator_name'),
-                     booking_data.get('from_journey'), booking_data.get('to_journey'),
-                     booking_data.get('vehicle_number'), booking_data.get('service_date'),
-                     booking_data.get('service_time'), booking_data.get('is_group_booking', 0),
-                     booking_data.get('customer_address'), booking_data.get('apply_gst', 1),
-                     booking_data.get('hotel_country'), booking_data.get('from_journey_country'),
-                     booking_data.get('to_journey_country')))
-        
-        booking_id = cur.lastrowid
+        booking_id = _insert_booking(cur, booking_data)
         con.commit()
-        return booking_id
+    invalidate_search_counts()
+    return booking_id
 
 
 def create_booking_customers(booking_id: int, customers: List[Dict[str, Any]]):
     """Create booking customers for group bookings"""
     with get_db_connection() as con:
         cur = con.cursor()
-        
-        for customer in customers:
-            cur.execute('''INSERT INTO booking_customers (booking_id, customer_name, customer_email, 
-                        customer_phone, seat_room_number, customer_amount)
-                        VALUES (?, ?, ?, ?, ?, ?)''',
-                        (booking_id, customer['name'], customer['email'], customer['phone'],
-                         customer['seat_room'], float(customer['amount'])))
-        
+        _insert_booking_customers(cur, booking_id, customers)
         con.commit()
 
 
+def create_group_booking(booking_data: Dict[str, Any], customers: List[Dict[str, Any]]) -> int:
+    """Create a group booking and its customers in a single transaction"""
+    with get_db_connection() as con:
+        cur = con.cursor()
+        booking_id = _insert_booking(cur, booking_data)
+        _insert_booking_customers(cur, booking_id, customers)
+        con.commit()
+    invalidate_search_counts()
+    return booking_id
+
+
 def get_booking_by_id(booking_id: int) -> Optional[Dict[str, Any]]:
     """Get booking details by ID"""
     with get_db_connection() as con:
@@ -155,24 +329,67 @@ def get_booking_by_id(booking_id: int) -> Optional[Dict[str, Any]]:
         booking = cur.fetchone()
         
         if booking:
-            booking_dict = dict(booking)
-            
             # Get customers for group bookings
-            if booking_dict['is_group_booking']:
+            customers = []
+            if booking['is_group_booking']:
                 cur.execute("SELECT * FROM booking_customers WHERE booking_id = ? ORDER BY id", (booking_id,))
                 customers = [dict(row) for row in cur.fetchall()]
-                booking_dict['customers'] = customers
-            else:
-                booking_dict['customers'] = []
             
-            return booking_dict
+            return dict(booking, customers=customers)
         
         return None
 
 
-def search_bookings(query: str = "", booking_type: str = "", page: int = 1, per_page: int = 10) -> Dict[str, Any]:
-    """Search bookings with pagination"""
+def get_bookings_by_ids(booking_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """Get several bookings (with their customers) in one round-trip, keyed by ID"""
+    if not booking_ids:
+        return {}
+
+    placeholders = ','.join('?' * len(booking_ids))
+    with get_db_connection() as con:
+        cur = con.cursor()
+        cur.execute(f"SELECT * FROM bookings WHERE id IN ({placeholders})", booking_ids)
+        bookings = {row['id']: dict(row, customers=[]) for row in cur.fetchall()}
+
+        # Get customers for group bookings
+        cur.execute(f"SELECT * FROM booking_customers WHERE booking_id IN ({placeholders}) ORDER BY id",
+                    booking_ids)
+        for row in cur.fetchall():
+            booking = bookings.get(row['booking_id'])
+            if booking and booking['is_group_booking']:
+                booking['customers'].append(dict(row))
+
+        return bookings
+
+
+def _encode_search_cursor(date: str, booking_id: int) -> str:
+    """Opaque search cursor pointing just past the booking with this date and id"""
+    return base64.urlsafe_b64encode(f'{date}|{booking_id}'.encode()).decode('ascii')
+
+
+def _decode_search_cursor(cursor: str) -> Tuple[str, int]:
+    """The (date, id) of a cursor from _encode_search_cursor; raises ValueError if malformed"""
+    try:
+        date, separator, booking_id = base64.urlsafe_b64decode(cursor).decode().rpartition('|')
+        if not separator:
+            raise ValueError
+        return date, int(booking_id)
+    except ValueError:
+        raise ValueError(f"Invalid search cursor: {cursor!r}") from None
+
+
+def search_bookings(query: str = "", booking_type: str = "", page: int = 1, per_page: int = 10,
+                    cursor: Optional[str] = None) -> Dict[str, Any]:
+    """Search bookings with pagination
+    
+    Pages are numbered, or with `cursor` (a previous result's next_cursor)
+    the page starts right after that result's last booking, which costs the
+    same however deep it is. A cursor page reports page as None, since its
+    number is not known, and always has a previous page. Raises ValueError
+    for a malformed cursor.
+    """
     offset = (page - 1) * per_page
+    after = _decode_search_cursor(cursor) if cursor else None
     
     with get_db_connection() as con:
         cur = con.cursor()
@@ -181,93 +398,117 @@ def search_bookings(query: str = "", booking_type: str = "", page: int = 1, per_
         count_sql = 'SELECT COUNT(*) FROM bookings WHERE 1=1'
         params = []
         
-        # Build dynamic query for fetching results
-        sql = '''SELECT id, name, email, phone, booking_type, base_amount, gst, total, date, 
-                        hotel_name, hotel_city, operator_name, from_journey, to_journey,
-                        vehicle_number, service_date, service_time, is_group_booking
+        # Build dynamic query for fetching results; group bookings get their
+        # customer count and first three names from correlated subqueries.
+        # Filters and ordering name bookings.<column>, as the bare names are
+        # the COALESCE'd result columns.
+        sql = f'''SELECT id, {_SEARCH_RESULT_SELECT},
+                        CASE WHEN is_group_booking THEN
+                            (SELECT COUNT(*) FROM booking_customers bc
+                             WHERE bc.booking_id = bookings.id)
+                        END AS customer_count,
+                        CASE WHEN is_group_booking THEN
+                            (SELECT GROUP_CONCAT(customer_name, char(31))
+                             FROM (SELECT customer_name FROM booking_customers bc
+                                   WHERE bc.booking_id = bookings.id ORDER BY id LIMIT 3))
+                        END AS customer_names
                  FROM bookings WHERE 1=1'''
         
         if query:
-            search_condition = ''' AND (name LIKE ? OR email LIKE ? OR phone LIKE ? 
-                          OR hotel_name LIKE ? OR operator_name LIKE ? 
-                          OR from_journey LIKE ? OR to_journey LIKE ? OR vehicle_number LIKE ?)'''
+            if len(query) >= _FTS_MIN_QUERY_LENGTH and cur.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bookings_fts'").fetchone():
+                # Substring match through the trigram index, quoted as a single phrase
+                search_condition = ' AND bookings.id IN (SELECT rowid FROM bookings_fts WHERE bookings_fts MATCH ?)'
+                params.append('"' + query.replace('"', '""') + '"')
+            else:
+                search_condition = ' AND (' + ' OR '.join(
+                    f'bookings.{column} LIKE ?' for column in _SEARCH_COLUMNS) + ')'
+                params.extend([f'%{query}%'] * len(_SEARCH_COLUMNS))
             count_sql += search_condition
             sql += search_condition
-            search_term = f'%{query}%'
-            params.extend([search_term] * 8)
         
         if booking_type:
-            type_condition = ' AND booking_type = ?'
+            type_condition = ' AND bookings.booking_type = ?'
             count_sql += type_condition
             sql += type_condition
             params.append(booking_type)
         
-        # Get total count for pagination
-        cur.execute(count_sql, params)
-        total_count = cur.fetchone()[0]
-        
-        # Add ordering and pagination to main query
-        sql += ' ORDER BY date DESC LIMIT ? OFFSET ?'
-        params.extend([per_page, offset])
-        
-        cur.execute(sql, params)
+        # Add ordering and pagination to main query; id breaks ties between
+        # equal dates so a cursor identifies a single position
+        page_params = list(params)
+        if after:
+            sql += ' AND (bookings.date, bookings.id) < (?, ?)'
+            page_params.extend(after)
+        sql += ' ORDER BY bookings.date DESC, bookings.id DESC LIMIT ? OFFSET ?'
+        # One row past the page tells whether there is a next page
+        page_params.extend([per_page + 1, 0 if after else offset])
+        
+        cur.execute(sql, page_params)
         rows = cur.fetchall()
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
+        
+        # A non-empty last page already gives the total; otherwise count
+        # the matches for pagination, once per search
+        if rows and not has_next and not after:
+            total_count = offset + len(rows)
+        else:
+            count_key = (query, booking_type)
+            total_count = _cached_search_count(count_key)
+            if total_count is None:
+                generation = _search_counts_generation
+                cur.execute(count_sql, params)
+                total_count = cur.fetchone()[0]
+                _store_search_count(count_key, total_count, generation)
         
         # Convert to list of dictionaries and add customer info for group bookings
         bookings = []
         for row in rows:
-            booking = dict(row)
+            booking = {key: row[key] for key in _SEARCH_RESULT_KEYS}
             
-            # If it's a group booking, get customer count and details
-            if booking['is_group_booking']:
-                cur.execute('SELECT COUNT(*) FROM booking_customers WHERE booking_id = ?', (booking['id'],))
-                customer_count = cur.fetchone()[0]
-                booking['customer_count'] = customer_count
-                
-                # Get customer names for display
-                cur.execute('SELECT customer_name FROM booking_customers WHERE booking_id = ? ORDER BY id LIMIT 3', (booking['id'],))
-                customer_names = [row[0] for row in cur.fetchall()]
-                booking['customer_names'] = customer_names
+            # Group bookings carry their customer count and names (joined with \x1f)
+            if row['is_group_booking']:
+                names = row['customer_names']
+                booking['customer_count'] = row['customer_count']
+                booking['customer_names'] = names.split('\x1f') if names else []
             else:
                 booking['customer_count'] = 1
-                booking['customer_names'] = [booking['name']]
-            
-            # Clean up None values
-            for key, value in booking.items():
-                if value is None:
-                    booking[key] = ''
+                booking['customer_names'] = [row['name']]
                     
             bookings.append(booking)
         
         # Calculate pagination info
         total_pages = (total_count + per_page - 1) // per_page
-        has_next = page < total_pages
-        has_prev = page > 1
+        has_prev = bool(after) or page > 1
+        next_cursor = _encode_search_cursor(rows[-1]['date'], rows[-1]['id']) if has_next else None
         
         return {
             'bookings': bookings,
             'pagination': {
-                'page': page,
+                'page': None if after else page,
                 'per_page': per_page,
                 'total': total_count,
                 'total_pages': total_pages,
                 'has_next': has_next,
-                'has_prev': has_prev
+                'has_prev': has_prev,
+                'next_cursor': next_cursor
             }
         }
 
 
+def get_booking_apply_gst(booking_id: int) -> bool:
+    """Whether GST is applied to a booking (True if the booking or flag is missing)"""
+    with get_db_connection() as con:
+        row = con.execute('SELECT apply_gst FROM bookings WHERE id = ?', (booking_id,)).fetchone()
+        return row is None or row['apply_gst'] is None or bool(row['apply_gst'])
+
+
 def update_booking(booking_id: int, booking_data: Dict[str, Any], customers: List[Dict[str, Any]] = None) -> bool:
     """Update an existing booking"""
     with get_db_connection() as con:
         cur = con.cursor()
         
-        # Check if booking exists
-        cur.execute('SELECT id FROM bookings WHERE id = ?', (booking_id,))
-        if not cur.fetchone():
-            return False
-        
-        # Update booking
+        # Update booking; no matching row means the booking does not exist
         cur.execute('''
             UPDATE bookings SET 
                 name = ?, email = ?, phone = ?, booking_type = ?,
@@ -275,7 +516,8 @@ def update_booking(booking_id: int, booking_data: Dict[str, Any], customers: Lis
                 hotel_name = ?, hotel_city = ?, hotel_country = ?,
                 operator_name = ?, from_journey = ?, from_journey_country = ?,
                 to_journey = ?, to_journey_country = ?, service_date = ?,
-                service_time = ?, vehicle_number = ?, is_group_booking = ?
+                service_time = ?, vehicle_number = ?, is_group_booking = ?,
+                apply_gst = COALESCE(?, apply_gst)
             WHERE id = ?
         ''', (
             booking_data['name'],
@@ -297,37 +539,34 @@ def update_booking(booking_id: int, booking_data: Dict[str, Any], customers: Lis
             booking_data.get('service_time'),
             booking_data.get('vehicle_number'),
             booking_data.get('is_group_booking', 0),
+            booking_data.get('apply_gst'),
             booking_id
         ))
         
-        rows_affected = cur.rowcount
+        if cur.rowcount == 0:
+            return False
         
         # Handle group booking customers
         if customers is not None:
             # Delete existing customers
             cur.execute('DELETE FROM booking_customers WHERE booking_id = ?', (booking_id,))
             
-            # Insert updated customers
-            for customer in customers:
-                if customer.get('customer_name', '').strip():
-                    cur.execute('''INSERT INTO booking_customers 
-                                 (booking_id, customer_name, customer_email, customer_phone, 
-                                  seat_room_number, customer_amount)
-                                 VALUES (?, ?, ?, ?, ?, ?)''',
-                              (booking_id,
-                               customer['customer_name'].strip(),
-                               customer.get('customer_email', '').strip() or None,
-                               customer.get('customer_phone', '').strip() or None,
-                               customer.get('seat_room_number', '').strip() or None,
-                               float(customer.get('customer_amount', 0))))
+            # Insert updated customers in one batch, skipping rows without a name
+            _insert_booking_customers(cur, booking_id, [
+                {'name': customer['customer_name'].strip(),
+                 'email': customer.get('customer_email', '').strip() or None,
+                 'phone': customer.get('customer_phone', '').strip() or None,
+                 'seat_room': customer.get('seat_room_number', '').strip() or None,
+                 'amount': customer.get('customer_amount', 0)}
+                for customer in customers
+                if customer.get('customer_name', '').strip()])
         else:
             # Remove any existing customers for non-group bookings
             cur.execute('DELETE FROM booking_customers WHERE booking_id = ?', (booking_id,))
         
         con.commit()
-        
-        # Return True if any changes were made (either booking update or customer changes)
-        return rows_affected > 0 or customers is not None
+    invalidate_search_counts()
+    return True
 
 
 def delete_booking(booking_id: int) -> Tuple[bool, str]:
@@ -335,58 +574,49 @@ def delete_booking(booking_id: int) -> Tuple[bool, str]:
     with get_db_connection() as con:
         cur = con.cursor()
         
-        # First check if booking exists and get info
-        cur.execute("SELECT id, name, is_group_booking FROM bookings WHERE id = ?", (booking_id,))
+        # Delete the booking, getting back what the message needs; a group
+        # booking's customers go with it through ON DELETE CASCADE
+        cur.execute("DELETE FROM bookings WHERE id = ? RETURNING name, is_group_booking", (booking_id,))
         booking = cur.fetchone()
         
         if not booking:
             return False, 'Booking not found'
         
-        # If it's a group booking, delete associated customers first
-        if booking[2]:  # is_group_booking
-            cur.execute("DELETE FROM booking_customers WHERE booking_id = ?", (booking_id,))
-        
-        # Delete the booking
-        cur.execute("DELETE FROM bookings WHERE id = ?", (booking_id,))
-        deleted_rows = cur.rowcount
         con.commit()
-        
-        if deleted_rows == 0:
-            return False, 'No booking was deleted'
-        
-        booking_type = "Group Booking" if booking[2] else "Booking"
-        message = f'{booking_type} #{str(booking_id).zfill(6)} for {booking[1]} has been deleted successfully'
-        return True, message
+    invalidate_search_counts()
+    
+    booking_type = "Group Booking" if booking['is_group_booking'] else "Booking"
+    message = f'{booking_type} #{booking_id:06d} for {booking["name"]} has been deleted successfully'
+    return True, message
 
 
 def bulk_delete_bookings(booking_ids: List[int]) -> Tuple[bool, str, int]:
     """Delete multiple bookings at once"""
-    deleted_count = 0
+    if not booking_ids:
+        return False, 'No bookings were deleted', 0
     
     with get_db_connection() as con:
         cur = con.cursor()
-        
-        for booking_id in booking_ids:
-            try:
-                # Check if booking exists before deleting
-                cur.execute("SELECT id FROM bookings WHERE id = ?", (booking_id,))
-                if cur.fetchone():
-                    # Delete customers first for group bookings
-                    cur.execute("DELETE FROM booking_customers WHERE booking_id = ?", (booking_id,))
-                    # Delete the booking
-                    cur.execute("DELETE FROM bookings WHERE id = ?", (booking_id,))
-                    if cur.rowcount > 0:
-                        deleted_count += 1
-            except sqlite3.Error as e:
-                print(f"Error deleting booking {booking_id}: {e}")
-                continue
-        
-        con.commit()
+        try:
+            # One set-based delete per batch of ids, all in one transaction; missing
+            # ids simply match nothing, and customers go through ON DELETE CASCADE
+            deleted_count = 0
+            for start in range(0, len(booking_ids), _MAX_IN_PARAMS):
+                batch = booking_ids[start:start + _MAX_IN_PARAMS]
+                placeholders = ','.join('?' * len(batch))
+                cur.execute(f"DELETE FROM bookings WHERE id IN ({placeholders})", batch)
+                deleted_count += cur.rowcount
+            con.commit()
+        except sqlite3.Error as e:
+            con.rollback()
+            logger.error(f"Error deleting bookings {booking_ids}: {e}")
+            deleted_count = 0
     
     if deleted_count == 0:
         return False, 'No bookings were deleted', 0
-    
-    elif deleted_count == 1:
+
+    invalidate_search_counts()
+    if deleted_count == 1:
         return True, '1 booking has been deleted successfully', deleted_count
     else:
         return True, f'{deleted_count} bookings have been deleted successfully', deleted_count
@@ -410,23 +640,15 @@ def set_config_value(key: str, value: str, config_type: str = 'string',
     with get_db_connection() as con:
         cur = con.cursor()
         
-        # Check if key exists
-        cur.execute("SELECT id FROM app_config WHERE config_key = ?", (key,))
-        exists = cur.fetchone()
-        
-        if exists:
-            # Update existing
-            cur.execute("""UPDATE app_config 
-                          SET config_value = ?, config_type = ?, category = ?, 
-                              description = ?, is_sensitive = ?, updated_at = CURRENT_TIMESTAMP 
-                          WHERE config_key = ?""", 
-                       (value, config_type, category, description, int(is_sensitive), key))
-        else:
-            # Insert new
-            cur.execute("""INSERT INTO app_config 
-                          (config_key, config_value, config_type, category, description, is_sensitive) 
-                          VALUES (?, ?, ?, ?, ?, ?)""", 
-                       (key, value, config_type, category, description, int(is_sensitive)))
+        # Insert new, or update the existing row for this key in the same statement
+        cur.execute("""INSERT INTO app_config 
+                      (config_key, config_value, config_type, category, description, is_sensitive) 
+                      VALUES (?, ?, ?, ?, ?, ?)
+                      ON CONFLICT(config_key) DO UPDATE 
+                      SET config_value = excluded.config_value, config_type = excluded.config_type, 
+                          category = excluded.category, description = excluded.description, 
+                          is_sensitive = excluded.is_sensitive, updated_at = CURRENT_TIMESTAMP""", 
+                   (key, value, config_type, category, description, int(is_sensitive)))
         
         con.commit()
         return True
@@ -477,8 +699,8 @@ def delete_all_config() -> bool:
         return cur.rowcount >= 0
 
 
-def get_all_bookings_for_export() -> List[Dict[str, Any]]:
-    """Get all bookings for export purposes"""
+def get_all_bookings_for_export(batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """Yield all bookings for export purposes, fetching batch_size rows at a time"""
     with get_db_connection() as con:
         cur = con.cursor()
         cur.execute('''SELECT b.*, 
@@ -489,7 +711,12 @@ def get_all_bookings_for_export() -> List[Dict[str, Any]]:
                        LEFT JOIN booking_customers bc ON b.id = bc.booking_id 
                        GROUP BY b.id 
                        ORDER BY b.date DESC''')
-        return [dict(row) for row in cur.fetchall()]
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
 
 
 def initialize_default_config():
@@ -524,6 +751,8 @@ def initialize_default_config():
         ('app_port', '8081', 'number', 'app', 'Application port'),
         ('backup_enabled', 'true', 'boolean', 'app', 'Enable automatic database backups'),
         ('backup_frequency', 'daily', 'string', 'app', 'Backup frequency (daily, weekly, monthly)'),
+        ('backup_mode', 'sqlite_backup_api', 'string', 'app', 'Backup mode (sqlite_backup_api, vacuum_into, incremental_pages)'),
+        ('backup_wal_cleanup', 'true', 'boolean', 'app', 'Checkpoint backups and switch them out of WAL mode'),
         
         # Email Configuration (for future use)
         ('email_enabled', 'false', 'boolean', 'email', 'Enable email notifications'),
@@ -533,8 +762,18 @@ def initialize_default_config():
         ('smtp_password', '', 'string', 'email', 'SMTP password', True),
     ]
     
-    for key, value, config_type, category, description, *is_sensitive in default_configs:
-        sensitive = is_sensitive[0] if is_sensitive else False
-        # Only set if not already exists
-        if not get_config_value(key):
-            set_config_value(key, value, config_type, category, description, sensitive)
+    rows = [(key, value, config_type, category, description, int(is_sensitive[0] if is_sensitive else False))
+            for key, value, config_type, category, description, *is_sensitive in default_configs]
+    
+    with get_db_connection() as con:
+        # Only set keys that do not exist yet or have no value, in one batch
+        con.executemany("""INSERT INTO app_config 
+                          (config_key, config_value, config_type, category, description, is_sensitive) 
+                          VALUES (?, ?, ?, ?, ?, ?)
+                          ON CONFLICT(config_key) DO UPDATE 
+                          SET config_value = excluded.config_value, config_type = excluded.config_type, 
+                              category = excluded.category, description = excluded.description, 
+                              is_sensitive = excluded.is_sensitive, updated_at = CURRENT_TIMESTAMP 
+                          WHERE app_config.config_value IS NULL OR app_config.config_value = ''""", 
+                       rows)
+        con.commit()
@@ -88,6 +88,8 @@ class ConfigManager:
             'app_port': 8081,
             'backup_enabled': True,
             'backup_frequency': 'daily',
+            'backup_mode': 'sqlite_backup_api',
+            'backup_wal_cleanup': True,
             
             # Email configuration
             'email_enabled': False,
@@ -253,6 +255,12 @@ def backup_enabled():
 def backup_frequency():
     return config.get_str('backup_frequency', 'daily')
 
+def backup_mode():
+    return config.get_str('backup_mode', 'sqlite_backup_api')
+
+def backup_wal_cleanup():
+    return config.get_bool('backup_wal_cleanup', True)
+
 # Email configuration functions
 def email_enabled():
     return config.get_bool('email_enabled', False)
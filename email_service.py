@@ -9,7 +9,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import os
 
 logger = logging.getLogger(__name__)
@@ -71,39 +71,10 @@ class EmailService:
             return False
         
         try:
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = smtp_config['from_email']
-            msg['To'] = ', '.join(to_emails)
-            msg['Subject'] = subject
-            
-            # Add body
-            if is_html:
-                msg.attach(MIMEText(body, 'html'))
-            else:
-                msg.attach(MIMEText(body, 'plain'))
-            
-            # Add attachments
-            if attachments:
-                for file_path in attachments:
-                    if os.path.exists(file_path):
-                        with open(file_path, 'rb') as attachment:
-                            part = MIMEBase('application', 'octet-stream')
-                            part.set_payload(attachment.read())
-                            encoders.encode_base64(part)
-                            part.add_header(
-                                'Content-Disposition',
-                                f'attachment; filename= {os.path.basename(file_path)}'
-                            )
-                            msg.attach(part)
-                    else:
-                        logger.warning(f"Attachment not found: {file_path}")
+            msg = self._build_message(smtp_config, to_emails, subject, body, is_html, attachments)
             
             # Send email
-            with smtplib.SMTP(smtp_config['server'], smtp_config['port']) as server:
-                if smtp_config['use_tls']:
-                    server.starttls()
-                server.login(smtp_config['username'], smtp_config['password'])
+            with self._open_smtp(smtp_config) as server:
                 server.send_message(msg)
             
             logger.info(f"Email sent successfully to {to_emails}")
@@ -113,13 +84,56 @@ class EmailService:
             logger.error(f"Failed to send email: {e}")
             return False
     
-    def send_booking_notification(self, booking_data: Dict[str, Any], 
-                                 pdf_path: Optional[str] = None) -> bool:
-        """Send booking confirmation email"""
-        if not booking_data.get('email'):
-            logger.info("No email address provided for booking notification")
-            return False
+    def _build_message(self, smtp_config: Dict[str, Any], to_emails: List[str], subject: str, body: str,
+                       is_html: bool = False, attachments: Optional[List[str]] = None) -> MIMEMultipart:
+        """Build a MIME message with optional file attachments"""
+        # Create message
+        msg = MIMEMultipart()
+        msg['From'] = smtp_config['from_email']
+        msg['To'] = ', '.join(to_emails)
+        msg['Subject'] = subject
+        
+        # Add body
+        if is_html:
+            msg.attach(MIMEText(body, 'html'))
+        else:
+            msg.attach(MIMEText(body, 'plain'))
+        
+        # Add attachments
+        if attachments:
+            for file_path in attachments:
+                # Open directly rather than stat first; a missing file is the rare case
+                try:
+                    with open(file_path, 'rb') as attachment:
+                        payload = attachment.read()
+                except FileNotFoundError:
+                    logger.warning(f"Attachment not found: {file_path}")
+                    continue
+                part = MIMEBase('application', 'octet-stream')
+                part.set_payload(payload)
+                encoders.encode_base64(part)
+                part.add_header(
+                    'Content-Disposition',
+                    f'attachment; filename= {os.path.basename(file_path)}'
+                )
+                msg.attach(part)
         
+        return msg
+    
+    def _open_smtp(self, smtp_config: Dict[str, Any]) -> smtplib.SMTP:
+        """Open an authenticated SMTP session"""
+        server = smtplib.SMTP(smtp_config['server'], smtp_config['port'])
+        try:
+            if smtp_config['use_tls']:
+                server.starttls()
+            server.login(smtp_config['username'], smtp_config['password'])
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _booking_email_content(self, booking_data: Dict[str, Any]) -> Tuple[str, str]:
+        """Subject and body of a booking confirmation email"""
         # Get business configuration
         from dynamic_config import agency_name, agency_email
         
@@ -144,7 +158,16 @@ For any queries, please contact us at {agency_email()}.
 Best regards,
 {agency_name()} Team
 """
+        return subject, body
+    
+    def send_booking_notification(self, booking_data: Dict[str, Any], 
+                                 pdf_path: Optional[str] = None) -> bool:
+        """Send booking confirmation email"""
+        if not booking_data.get('email'):
+            logger.info("No email address provided for booking notification")
+            return False
         
+        subject, body = self._booking_email_content(booking_data)
         attachments = [pdf_path] if pdf_path and os.path.exists(pdf_path) else []
         
         return self.send_email(
@@ -154,6 +177,58 @@ Best regards,
             attachments=attachments
         )
     
+    def send_booking_notifications(self, bookings: List[Tuple[Dict[str, Any], Optional[str]]]) -> int:
+        """Send a batch of booking confirmation emails over a single SMTP session
+        
+        Takes (booking_data, pdf_path) pairs and returns the number of emails sent.
+        """
+        if not self.is_enabled():
+            logger.info("Email service is disabled")
+            return 0
+        
+        smtp_config = self.get_smtp_config()
+        if not all([smtp_config['server'], smtp_config['username'], smtp_config['password']]):
+            logger.error("Incomplete SMTP configuration")
+            return 0
+        
+        pending = [(booking_data, pdf_path) for booking_data, pdf_path in bookings
+                   if booking_data.get('email')]
+        sent = 0
+        handled = 0
+        unsent = []
+        try:
+            with self._open_smtp(smtp_config) as server:
+                for booking_data, pdf_path in pending:
+                    subject, body = self._booking_email_content(booking_data)
+                    attachments = [pdf_path] if pdf_path else []
+                    # A failure that only concerns this email (an unreadable attachment,
+                    # a refused sender, recipient or message) skips it; losing the
+                    # connection ends the session
+                    try:
+                        msg = self._build_message(smtp_config, [booking_data['email']], subject, body,
+                                                  attachments=attachments)
+                    except OSError as e:
+                        logger.error(f"Failed to build booking email for booking {booking_data.get('id')}: {e}")
+                        unsent.append(booking_data.get('id'))
+                    else:
+                        try:
+                            server.send_message(msg)
+                            sent += 1
+                        except smtplib.SMTPServerDisconnected:
+                            raise
+                        except smtplib.SMTPException as e:
+                            logger.error(f"Failed to send booking email to {booking_data['email']}: {e}")
+                            unsent.append(booking_data.get('id'))
+                    handled += 1
+        except Exception as e:
+            logger.error(f"Failed to send booking emails: {e}")
+            unsent.extend(booking_data.get('id') for booking_data, _ in pending[handled:])
+        
+        if unsent:
+            logger.error(f"Booking emails not sent for bookings {unsent}")
+        logger.info(f"Sent {sent} of {len(pending)} booking emails")
+        return sent
+    
     def test_email_configuration(self, test_email: str) -> Dict[str, Any]:
         """Test email configuration by sending a test email"""
         if not self.is_enabled():
@@ -213,6 +288,10 @@ def send_booking_email(booking_data: Dict[str, Any], pdf_path: Optional[str] = N
     """Convenience function to send booking email"""
     return email_service.send_booking_notification(booking_data, pdf_path)
 
+def send_booking_emails(bookings: List[Tuple[Dict[str, Any], Optional[str]]]) -> int:
+    """Convenience function to send a batch of booking emails"""
+    return email_service.send_booking_notifications(bookings)
+
 def test_email_config(test_email: str) -> Dict[str, Any]:
     """Convenience function to test email configuration"""
     return email_service.test_email_configuration(test_email)
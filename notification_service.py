@@ -0,0 +1,180 @@
+"""
+Notification Service for Himanshi Travels
+Sends booking confirmations (invoice PDF, WhatsApp and email) off the request thread
+"""
+
+import os
+import atexit
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from database import get_bookings_by_ids
+from dynamic_config import whatsapp_enabled, whatsapp_send_on_booking
+import dynamic_config
+from email_service import email_service, send_booking_emails
+from whatsapp_service import send_booking_whatsapp, send_booking_whatsapp_with_pdf
+# Module import: pdf_generator imports booking_logic, which imports this module
+import pdf_generator
+
+logger = logging.getLogger(__name__)
+
+dynamic_config.init_module_constants()
+BILLS_DIRECTORY = dynamic_config.BILLS_DIRECTORY
+
+# Pending notifications are sent every NOTIFICATION_FLUSH_INTERVAL seconds,
+# or as soon as NOTIFICATION_BATCH_SIZE bookings are waiting
+NOTIFICATION_FLUSH_INTERVAL = float(os.environ.get('HT_NOTIFICATION_FLUSH_INTERVAL', 60))
+NOTIFICATION_BATCH_SIZE = int(os.environ.get('HT_NOTIFICATION_BATCH_SIZE', 50))
+
+
+class NotificationQueue:
+    """Collects booking ids and sends their notifications in periodic batches"""
+
+    def __init__(self, flush_interval: float = NOTIFICATION_FLUSH_INTERVAL,
+                 batch_size: int = NOTIFICATION_BATCH_SIZE):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._pending: List[int] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker = None
+
+    def add(self, booking_id: int):
+        """Queue a booking for the next batch and return immediately"""
+        with self._lock:
+            self._pending.append(booking_id)
+            batch_full = len(self._pending) >= self.batch_size
+            self._ensure_worker()
+        if batch_full:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """Send notifications for every pending booking; returns the batch size"""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if batch:
+            send_notifications_batch(batch)
+        return len(batch)
+
+    def _ensure_worker(self):
+        """Start the flush thread if it is not already running (caller holds the lock)"""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name='notification-worker',
+                                            daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        """Worker loop: flush on every interval, or early when a batch fills up"""
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Notification batch failed: {e}")
+
+
+# Global notification queue instance
+notification_queue = NotificationQueue()
+
+# Don't drop bookings still waiting for the next flush on shutdown
+atexit.register(notification_queue.flush)
+
+
+def _booking_recipients(booking: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """WhatsApp recipients for a booking: every group member, or the single customer"""
+    if booking.get('customers'):
+        return [{'name': c['customer_name'], 'phone': c['customer_phone']}
+                for c in booking['customers']]
+    return [{'name': booking['name'], 'phone': booking['phone']}]
+
+
+def _invoice_is_current(pdf_path: str, booking: Dict[str, Any]) -> bool:
+    """Whether the invoice on disk was rendered for this booking
+    
+    Ids come back after a restore and bills/ can hold invoices from another
+    database, so a file only counts if it is no older than the booking's date.
+    """
+    try:
+        booked_at = datetime.fromisoformat(booking['date'])
+        return datetime.fromtimestamp(os.path.getmtime(pdf_path)) >= booked_at
+    except (KeyError, TypeError, ValueError, OSError):
+        return False
+
+
+def _ensure_invoice_pdf(booking_id: int, booking: Dict[str, Any]) -> Optional[str]:
+    """Path to the booking's invoice PDF, rendering it unless a current one is on disk
+    
+    Returns None if the PDF cannot be generated.
+    """
+    pdf_path = f'{BILLS_DIRECTORY}/invoice_{booking_id}.pdf'
+    if _invoice_is_current(pdf_path, booking):
+        return pdf_path
+    try:
+        return pdf_generator.generate_invoice_pdf(booking_id, booking, booking.get('customers') or None)
+    except Exception as pdf_error:
+        logger.error(f"PDF generation failed for booking {booking_id}: {pdf_error}")
+        return None
+
+
+def _send_whatsapp(booking_id: int, booking: Dict[str, Any], pdf_path: Optional[str]):
+    """Send the WhatsApp confirmation, without the PDF if none could be rendered"""
+    recipients = _booking_recipients(booking)
+    try:
+        if pdf_path:
+            success, message = send_booking_whatsapp_with_pdf(booking, recipients, pdf_path)
+        else:
+            # Fallback to sending message without PDF
+            success, message = send_booking_whatsapp(booking, recipients)
+        if success:
+            logger.info(f"WhatsApp message sent for booking {booking_id}")
+        else:
+            logger.warning(f"WhatsApp failed for booking {booking_id}: {message}")
+    except Exception as whatsapp_error:
+        logger.error(f"WhatsApp service error for booking {booking_id}: {whatsapp_error}")
+
+
+def send_notifications_batch(booking_ids: List[int]):
+    """Load a batch of bookings in one query, then send their WhatsApp and email confirmations
+
+    Emails for the whole batch share one SMTP session.
+    """
+    booking_ids = list(dict.fromkeys(booking_ids))
+    bookings = get_bookings_by_ids(booking_ids)
+
+    send_whatsapp = whatsapp_enabled() and whatsapp_send_on_booking()
+    send_email = email_service.is_enabled()
+    emails = []
+
+    for booking_id in booking_ids:
+        booking = bookings.get(booking_id)
+        if not booking:
+            logger.warning(f"Booking {booking_id} not found, skipping notifications")
+            continue
+
+        email = (booking.get('email') or '').strip() if send_email else ''
+        if not (send_whatsapp or email):
+            continue
+
+        pdf_path = _ensure_invoice_pdf(booking_id, booking)
+        if send_whatsapp:
+            _send_whatsapp(booking_id, booking, pdf_path)
+        if email:
+            emails.append(({
+                'id': booking_id,
+                'name': booking['name'],
+                'email': email,
+                'booking_type': booking['booking_type'],
+                'total': booking['total'],
+                'date': booking['date']
+            }, pdf_path))
+
+    if emails:
+        send_booking_emails(emails)
+
+
+def queue_booking_notifications(booking_id: int):
+    """Convenience function to send booking notifications with the next batch"""
+    notification_queue.add(booking_id)
@@ -26,7 +26,8 @@ AGENCY_EMAIL = dynamic_config.AGENCY_EMAIL
 GST_PERCENT = dynamic_config.GST_PERCENT
 LOGO_PATH = dynamic_config.LOGO_PATH
 BILLS_DIRECTORY = dynamic_config.BILLS_DIRECTORY
-from booking_logic import get_vehicle_label
+# Module import: booking_logic (via notification_service) imports this module too
+import booking_logic
 
 
 def setup_pdf_styles():
@@ -166,7 +167,7 @@ def create_service_details_section(story: List, booking: Dict[str, Any], styles:
     
     # Add service details
     if booking['vehicle_number']:
-        vehicle_label = get_vehicle_label(booking['booking_type'])
+        vehicle_label = booking_logic.get_vehicle_label(booking['booking_type'])
         service_data.append([vehicle_label, booking['vehicle_number']])
     if booking['service_date']:
         service_data.append(['Date:', booking['service_date']])
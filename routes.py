@@ -7,13 +7,24 @@ import csv
 import io
 import logging
 from datetime import datetime
-from flask import Flask, render_template, request, redirect, send_file, make_response, jsonify, send_from_directory
+from flask import (Flask, Response, render_template, request, redirect, send_file, jsonify,
+                   send_from_directory, stream_with_context)
 
 logger = logging.getLogger(__name__)
 
 # Constants
 DEFAULT_LOGO_PATH = 'static/images/himanshi_travels_logo.png'
 
+# CSV export columns: (header, booking field)
+EXPORT_COLUMNS = (
+    ('ID', 'id'), ('Name', 'name'), ('Email', 'email'), ('Phone', 'phone'),
+    ('Booking Type', 'booking_type'), ('Base Amount', 'base_amount'), ('GST', 'gst'),
+    ('Total', 'total'), ('Date', 'date'), ('Hotel Name', 'hotel_name'),
+    ('Hotel City', 'hotel_city'), ('Operator', 'operator_name'), ('From', 'from_journey'),
+    ('To', 'to_journey')
+)
+EXPORT_CHUNK_SIZE = 64 * 1024
+
 from dynamic_config import DEFAULT_PAGE_SIZE
 import dynamic_config
 
@@ -100,8 +111,15 @@ def register_routes(app):
         booking_type = request.args.get('type', '')
         page = int(request.args.get('page', 1))
         per_page = int(request.args.get('per_page', DEFAULT_PAGE_SIZE))
+        cursor = request.args.get('cursor') or None
         
-        result = search_bookings(query, booking_type, page, per_page)
+        try:
+            result = search_bookings(query, booking_type, page, per_page, cursor)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'message': str(e)
+            }), 400
         return result
 
     @app.route('/regenerate_invoice/<int:booking_id>')
@@ -113,24 +131,25 @@ def register_routes(app):
     def export_bookings():
         """Export all bookings to CSV"""
         rows = get_all_bookings_for_export()
+        fields = [field for _, field in EXPORT_COLUMNS]
         
-        # Create CSV in memory
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write headers
-        headers = ['ID', 'Name', 'Email', 'Phone', 'Booking Type', 'Base Amount', 'GST', 'Total', 'Date',
-                   'Hotel Name', 'Hotel City', 'Operator', 'From', 'To']
-        writer.writerow(headers)
-        
-        # Write data
-        for row in rows:
-            writer.writerow(row)
+        def generate_csv():
+            # Stream the CSV in chunks as bookings are read, instead of building it in memory
+            output = io.StringIO()
+            writer = csv.writer(output)
+            writer.writerow([header for header, _ in EXPORT_COLUMNS])
+            
+            for row in rows:
+                writer.writerow([row[field] for field in fields])
+                if output.tell() >= EXPORT_CHUNK_SIZE:
+                    yield output.getvalue()
+                    output.seek(0)
+                    output.truncate()
+            
+            yield output.getvalue()
         
         # Create response
-        output.seek(0)
-        response = make_response(output.getvalue())
-        response.headers['Content-Type'] = 'text/csv'
+        response = Response(stream_with_context(generate_csv()), mimetype='text/csv')
         response.headers['Content-Disposition'] = f'attachment; filename=himanshi_travels_bookings_{datetime.now().strftime("%Y%m%d")}.csv'
         
         return response
@@ -148,14 +167,14 @@ def register_routes(app):
                     try:
                         os.remove(invoice_path)
                     except OSError as e:
-                        print(f"Warning: Could not delete invoice file {invoice_path}: {e}")
+                        logger.warning(f"Could not delete invoice file {invoice_path}: {e}")
                 
                 return {'success': True, 'message': message}
             else:
                 return {'success': False, 'message': message}, 404 if 'not found' in message else 400
                 
         except Exception as e:
-            print(f"Unexpected error: {e}")
+            logger.error(f"Unexpected error: {e}")
             return {'success': False, 'message': f'Unexpected error: {str(e)}'}, 500
 
     @app.route('/bulk_delete_bookings', methods=['POST'])
@@ -184,7 +203,7 @@ def register_routes(app):
                         try:
                             os.remove(invoice_path)
                         except OSError as e:
-                            print(f"Warning: Could not delete invoice file {invoice_path}: {e}")
+                            logger.warning(f"Could not delete invoice file {invoice_path}: {e}")
                 
                 return {
                     'success': True,
@@ -195,7 +214,7 @@ def register_routes(app):
                 return {'success': False, 'message': message}, 400
                 
         except Exception as e:
-            print(f"Unexpected error during bulk delete: {e}")
+            logger.error(f"Unexpected error during bulk delete: {e}")
             return {'success': False, 'message': f'Unexpected error: {str(e)}'}, 500
 
     @app.route('/get_booking/<int:booking_id>')
@@ -212,7 +231,7 @@ def register_routes(app):
                 'booking': booking
             }
         except Exception as e:
-            print(f"Unexpected error getting booking {booking_id}: {e}")
+            logger.error(f"Unexpected error getting booking {booking_id}: {e}")
             return {'success': False, 'message': f'Unexpected error: {str(e)}'}, 500
 
     @app.route('/update_booking/<int:booking_id>', methods=['POST'])
@@ -232,7 +251,7 @@ def register_routes(app):
                 return {'success': False, 'message': message}, 400
                 
         except Exception as e:
-            print(f"Unexpected error updating booking {booking_id}: {e}")
+            logger.error(f"Unexpected error updating booking {booking_id}: {e}")
             return {'success': False, 'message': f'Unexpected error: {str(e)}'}, 500
 
     # Auto-complete endpoints using External API Service
@@ -392,11 +411,12 @@ def register_routes(app):
     @app.route('/config')
     def config_page():
         """Configuration management page with modular design"""
-        from config import ConfigManager, ConfigCategory
+        from dataclasses import replace
+        from config import get_config_manager, ConfigCategory
         from database import get_all_config
         
-        # Initialize the modular config manager
-        config_manager = ConfigManager()
+        # Shared modular config manager
+        config_manager = get_config_manager()
         
         # Get current values from database
         current_config = get_all_config()
@@ -415,10 +435,11 @@ def register_routes(app):
             # Get fields for this category
             fields = config_manager.get_fields_by_category(category)
             
-            # Update field values with current database values
-            for field in fields:
-                if field.key in current_values:
-                    field.value = current_values[field.key]
+            # Show current database values (fields are shared and immutable, so copy them)
+            fields = [
+                replace(field, value=current_values[field.key]) if field.key in current_values else field
+                for field in fields
+            ]
             
             category_fields[category] = fields
             category_names[category] = config_manager.get_category_display_name(category)
@@ -946,10 +967,10 @@ def register_routes(app):
     def save_config_modular():
         """Save configuration values using modular config manager"""
         try:
-            from config import ConfigManager
+            from config import get_config_manager
             from database import set_config_value
             
-            config_manager = ConfigManager()
+            config_manager = get_config_manager()
             data = request.get_json()
             
             if not data:
@@ -959,7 +980,7 @@ def register_routes(app):
                 }), 400
             
             # Validate and save configurations
-            validation_results = config_manager.validate_batch_configs(data)
+            validation_results = config_manager.validate_batch_configs(data, collect_valid=False)
             
             if validation_results['invalid']:
                 return jsonify({
@@ -1038,12 +1059,11 @@ def register_routes(app):
                 # Database connectivity test
                 try:
                     from database import get_db_connection
-                    conn = get_db_connection()
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT 1")
-                    result = cursor.fetchone()
-                    cursor.close()
-                    conn.close()
+                    with get_db_connection() as conn:
+                        cursor = conn.cursor()
+                        cursor.execute("SELECT 1")
+                        result = cursor.fetchone()
+                        cursor.close()
                     
                     return jsonify({
                         'success': True,
@@ -1131,10 +1151,10 @@ def register_routes(app):
     def reset_config_category(category):
         """Reset a specific category to default values"""
         try:
-            from config import ConfigManager, ConfigCategory
+            from config import get_config_manager, ConfigCategory
             from database import set_config_value
             
-            config_manager = ConfigManager()
+            config_manager = get_config_manager()
             
             # Find the category enum
             target_category = None
@@ -2,7 +2,7 @@
 Validation functions for Himanshi Travels application
 """
 
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Optional
 from utils import validate_email, validate_phone, safe_float_conversion
 
 
@@ -10,38 +10,45 @@ class BookingValidator:
     """Validator class for booking data"""
     
     @staticmethod
-    def validate_single_booking(form_data: Dict[str, Any]) -> Tuple[bool, str]:
-        """Validate single customer booking data"""
-        required_fields = ['name', 'phone', 'booking_type', 'base_amount']
+    def clean_single_booking(form_data: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Validate single customer booking data and normalize it in one pass
+        
+        Returns the stripped name/phone/booking_type, the parsed base_amount and
+        the email (or None), or None with the first validation error.
+        """
+        cleaned = {}
         
         # Check required fields
-        for field in required_fields:
+        for field in ('name', 'phone', 'booking_type'):
             value = form_data.get(field)
-            
-            if field == 'base_amount':
-                # For numeric fields, check if it exists and is valid
-                if value is None or safe_float_conversion(value) <= 0:
-                    return False, f'Missing or invalid field: {field}'
-            else:
-                # For string fields, check if it exists and is not empty after stripping
-                if not value or not str(value).strip():
-                    return False, f'Missing required field: {field}'
+            value = str(value).strip() if value else ''
+            if not value:
+                return None, f'Missing required field: {field}'
+            cleaned[field] = value
+        
+        base_amount = safe_float_conversion(form_data.get('base_amount'))
+        if base_amount <= 0:
+            return None, 'Missing or invalid field: base_amount'
+        cleaned['base_amount'] = base_amount
         
         # Validate email format if provided
-        email = form_data.get('email', '')
-        if email and not validate_email(str(email).strip()):
-            return False, 'Please enter a valid email address'
+        email = form_data.get('email')
+        email = str(email).strip() if email else ''
+        if email and not validate_email(email):
+            return None, 'Please enter a valid email address'
+        cleaned['email'] = email or None
         
         # Validate phone number
-        if not validate_phone(str(form_data['phone']).strip()):
-            return False, 'Please enter a valid phone number (minimum 10 digits)'
+        if not validate_phone(cleaned['phone']):
+            return None, 'Please enter a valid phone number (minimum 10 digits)'
         
-        # Validate base amount
-        base_amount = safe_float_conversion(form_data['base_amount'])
-        if base_amount <= 0:
-            return False, 'Base amount must be greater than 0'
-        
-        return True, ''
+        return cleaned, ''
+    
+    @staticmethod
+    def validate_single_booking(form_data: Dict[str, Any]) -> Tuple[bool, str]:
+        """Validate single customer booking data"""
+        cleaned, error_msg = BookingValidator.clean_single_booking(form_data)
+        return cleaned is not None, error_msg
     
     @staticmethod
     def validate_group_booking(form_data: Dict[str, Any], customers: List[Dict[str, Any]]) -> Tuple[bool, str]:
@@ -7,8 +7,6 @@ import logging
 from typing import Tuple, Optional
 from abc import ABC, abstractmethod
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 